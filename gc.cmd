@@ -0,0 +1,2 @@
+python -m pipx run poetry run python -m openbachelorm.cache_gc %*
+pause
@@ -5,4 +5,11 @@ flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v
 flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_5_60/ fbs/2.5.60/prts___levels.fbs
 flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_5_04/ fbs/2.5.04/prts___levels.fbs
 flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_4_61/ fbs/2.4.61/prts___levels.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_6_41/ fbs/2.6.41/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_6_21/ fbs/2.6.21/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_6_01/ fbs/2.6.01/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_5_80/ fbs/2.5.80/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_5_60/ fbs/2.5.60/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_5_04/ fbs/2.5.04/resource_manifest.fbs
+flatc --python --gen-onefile --gen-object-api -o src/openbachelorm/fbs_codegen/v2_4_61/ fbs/2.4.61/resource_manifest.fbs
 pause
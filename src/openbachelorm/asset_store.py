@@ -0,0 +1,39 @@
+import os
+import shutil
+from pathlib import Path
+
+from .const import ASSET_STORE_DIRPATH
+from .config import config
+from .downloader import get_part_filepath
+
+
+def is_asset_store_enabled() -> bool:
+    return config.get("asset_store", True)
+
+
+def get_asset_store_filepath(md5: str, suffix: str) -> Path:
+    md5 = md5.lower()
+
+    return Path(ASSET_STORE_DIRPATH, md5[:2], f"{md5}{suffix}")
+
+
+def link_asset(blob_filepath: Path, asset_filepath: Path):
+    asset_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    part_filepath = get_part_filepath(asset_filepath)
+
+    try:
+        try:
+            os.link(blob_filepath, part_filepath)
+        except OSError:
+            shutil.copyfile(blob_filepath, part_filepath)
+
+        part_filepath.replace(asset_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def remove_asset_blob(md5: str):
+    for suffix in (".dat", ".ab"):
+        get_asset_store_filepath(md5, suffix).unlink(missing_ok=True)
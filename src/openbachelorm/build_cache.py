@@ -0,0 +1,263 @@
+import json
+import types
+import hashlib
+from enum import Enum
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+
+from .const import BUILD_CACHE_DIRPATH
+from .config import config
+from .downloader import get_part_filepath
+from .verify import get_file_stamp
+
+
+# bump when the fingerprint or record format changes
+BUILD_CACHE_VERSION = 1
+
+FINGERPRINT_SCALAR_TYPE_TUPLE = (str, bytes, int, float, bool, type(None))
+
+# lru_cache and cache wrappers are followed to the function they wrap
+FUNCTOOLS_WRAPPER_TYPE_TUPLE = (type(lru_cache(lambda: None)),)
+
+
+def is_build_cache_enabled() -> bool:
+    return config.get("build_cache", True)
+
+
+@lru_cache
+def get_openbachelorm_version() -> str:
+    try:
+        return version("openbachelorm")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+PACKAGE_DIRPATH = Path(__file__).parent
+
+
+@lru_cache
+def get_openbachelorm_source_digest() -> str:
+    # a source checkout keeps its version number while the code changes
+    h = hashlib.sha256()
+
+    for filepath in sorted(PACKAGE_DIRPATH.rglob("*.py")):
+        h.update(filepath.relative_to(PACKAGE_DIRPATH).as_posix().encode())
+        h.update(filepath.read_bytes())
+
+    return h.hexdigest()
+
+
+def is_package_func(func: types.FunctionType) -> bool:
+    return func.__module__ == __package__ or func.__module__.startswith(
+        f"{__package__}."
+    )
+
+
+def update_value_hash(h, value, seen_id_set: set[int]):
+    if isinstance(value, FINGERPRINT_SCALAR_TYPE_TUPLE):
+        h.update(repr(value).encode("utf-8", "surrogateescape"))
+
+    elif isinstance(value, Enum):
+        h.update(f"{type(value).__qualname__}.{value.name}".encode())
+
+    elif isinstance(value, (tuple, list, set, frozenset, dict)):
+        h.update(type(value).__name__.encode())
+
+        # only guards against cycles, temporaries may reuse an id later on
+        if id(value) in seen_id_set:
+            return
+
+        seen_id_set.add(id(value))
+
+        try:
+            # set order follows the per-process string hash seed
+            if isinstance(value, (set, frozenset)):
+                item_lst = sorted(value, key=repr)
+
+            elif isinstance(value, dict):
+                item_lst = sorted(value.items(), key=lambda i: repr(i[0]))
+
+            else:
+                item_lst = value
+
+            for i in item_lst:
+                update_value_hash(h, i, seen_id_set)
+
+        finally:
+            seen_id_set.discard(id(value))
+
+    elif isinstance(value, types.CodeType):
+        update_code_hash(h, value, seen_id_set)
+
+    elif isinstance(value, types.FunctionType):
+        update_func_hash(h, value, seen_id_set)
+
+    elif isinstance(value, FUNCTOOLS_WRAPPER_TYPE_TUPLE):
+        update_value_hash(h, value.__wrapped__, seen_id_set)
+
+    elif isinstance(value, partial):
+        update_value_hash(
+            h,
+            (value.func, value.args, value.keywords),
+            seen_id_set,
+        )
+
+    elif isinstance(value, (type, types.ModuleType, types.BuiltinFunctionType)):
+        # library code is covered by the package version, not followed
+        h.update(getattr(value, "__qualname__", value.__name__).encode())
+
+    elif type(value) is object:
+        # a sentinel such as UNCHANGED, it carries no state
+        h.update(b"object")
+
+    else:
+        raise TypeError(f"cannot fingerprint {type(value).__qualname__}")
+
+
+def update_code_hash(h, code: types.CodeType, seen_id_set: set[int]):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+
+    for const in code.co_consts:
+        update_value_hash(h, const, seen_id_set)
+
+
+def update_func_hash(h, func: types.FunctionType, seen_id_set: set[int]):
+    if id(func) in seen_id_set:
+        h.update(func.__qualname__.encode())
+        return
+
+    seen_id_set.add(id(func))
+
+    h.update(func.__qualname__.encode())
+
+    # package code is covered by the source digest, only its arguments count
+    is_package = is_package_func(func)
+
+    if is_package:
+        h.update(func.__module__.encode())
+    else:
+        update_code_hash(h, func.__code__, seen_id_set)
+
+    update_value_hash(h, func.__defaults__, seen_id_set)
+
+    if func.__closure__:
+        for cell in func.__closure__:
+            try:
+                update_value_hash(h, cell.cell_contents, seen_id_set)
+            except ValueError:
+                pass
+
+    if is_package:
+        return
+
+    # helper functions, constants and tables the mod refers to by global name
+    for name in get_global_name_lst(func.__code__):
+        if name not in func.__globals__:
+            continue
+
+        h.update(name.encode())
+        update_value_hash(h, func.__globals__[name], seen_id_set)
+
+
+def get_global_name_lst(code: types.CodeType) -> list[str]:
+    name_lst = list(code.co_names)
+
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            name_lst.extend(get_global_name_lst(const))
+
+    return name_lst
+
+
+def get_func_fingerprint(func) -> str | None:
+    h = hashlib.sha256()
+
+    try:
+        update_value_hash(h, func, set())
+    except TypeError as e:
+        print(f"info: {getattr(func, '__qualname__', func)} is not cached, {e}")
+        return None
+
+    return h.hexdigest()
+
+
+def get_fingerprint(*part_lst) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [
+                BUILD_CACHE_VERSION,
+                get_openbachelorm_version(),
+                get_openbachelorm_source_digest(),
+                config.get("mod_compression"),
+                config.get("mod_compress_level"),
+                *part_lst,
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def get_build_cache_filepath(mod_name: str) -> Path:
+    return Path(BUILD_CACHE_DIRPATH, f"{mod_name}.json")
+
+
+def load_build_cache(mod_name: str) -> dict[str, dict]:
+    try:
+        with open(get_build_cache_filepath(mod_name), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_cache(mod_name: str, build_cache: dict[str, dict]):
+    build_cache_filepath = get_build_cache_filepath(mod_name)
+
+    build_cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    part_filepath = get_part_filepath(build_cache_filepath)
+
+    try:
+        with open(part_filepath, "w", encoding="utf-8") as f:
+            json.dump(build_cache, f)
+
+        part_filepath.replace(build_cache_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def is_build_cache_hit(
+    build_cache_entry: dict | None, fingerprint: str | None, mod_filepath: Path
+) -> bool:
+    if fingerprint is None or build_cache_entry is None:
+        return False
+
+    # the stamp catches outputs edited or removed since they were recorded
+    return build_cache_entry["fingerprint"] == fingerprint and build_cache_entry[
+        "stamp"
+    ] == get_file_stamp(mod_filepath)
+
+
+def get_build_cache_entry(fingerprint: str, mod_filepath: Path) -> dict:
+    return {"fingerprint": fingerprint, "stamp": get_file_stamp(mod_filepath)}
+
+
+@dataclass
+class BuildReport:
+    hit_ab_name_lst: list[str] = field(default_factory=list)
+    miss_ab_name_lst: list[str] = field(default_factory=list)
+
+
+def run_cached_build_task(
+    task,
+    ab_name: str,
+    fingerprint: str | None,
+    mod_filepath: Path,
+    build_cache: dict[str, dict],
+):
+    task()
+
+    if fingerprint is not None:
+        build_cache[ab_name] = get_build_cache_entry(fingerprint, mod_filepath)
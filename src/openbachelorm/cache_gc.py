@@ -0,0 +1,308 @@
+import os
+import sys
+import json
+import time
+import atexit
+import argparse
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .const import ASSET_DIRPATH, TMP_DIRPATH, PIN_DIRPATH, ACCESS_INDEX_FILEPATH
+from .config import config
+from .downloader import get_part_filepath
+
+
+DEFAULT_PIN_MAX_AGE = 24 * 60 * 60
+
+# small bookkeeping files that are cheaper to keep than to rebuild
+GC_EXCLUDED_NAME_SET = {
+    "hot_update_list.json",
+    "verify_record.json",
+    "hot_update_list_validator.json",
+    "anon_index.json",
+    Path(ACCESS_INDEX_FILEPATH).name,
+}
+
+
+def get_pin_max_age() -> float:
+    return config.get("pin_max_age", DEFAULT_PIN_MAX_AGE)
+
+
+access_lock = threading.Lock()
+access_dict: dict[str, float] = {}
+
+
+def get_access_key(filepath: Path) -> str:
+    return Path(os.path.relpath(filepath)).as_posix()
+
+
+def record_access(filepath: Path):
+    with access_lock:
+        access_dict[get_access_key(filepath)] = time.time()
+
+
+def load_access_index() -> dict[str, float]:
+    try:
+        with open(ACCESS_INDEX_FILEPATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_access_index(access_index: dict[str, float]):
+    access_index_filepath = Path(ACCESS_INDEX_FILEPATH)
+
+    access_index_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    part_filepath = get_part_filepath(access_index_filepath)
+
+    try:
+        with open(part_filepath, "w", encoding="utf-8") as f:
+            json.dump(access_index, f)
+
+        part_filepath.replace(access_index_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def flush_access_index():
+    with access_lock:
+        if not access_dict:
+            return
+
+        access_index = load_access_index()
+
+        for key, access_time in access_dict.items():
+            access_index[key] = max(access_index.get(key, 0), access_time)
+
+        access_dict.clear()
+
+        save_access_index(access_index)
+
+
+pin_lock = threading.Lock()
+pin_path_lst: list[str] = []
+
+
+def get_pin_filepath() -> Path:
+    return Path(PIN_DIRPATH, f"{os.getpid()}.json")
+
+
+def remove_pin():
+    get_pin_filepath().unlink(missing_ok=True)
+
+
+def pin_path(path: Path):
+    with pin_lock:
+        pin_path_lst.append(get_access_key(path))
+
+        pin_filepath = get_pin_filepath()
+        pin_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(pin_filepath, "w", encoding="utf-8") as f:
+            json.dump({"pid": os.getpid(), "path_lst": pin_path_lst}, f)
+
+
+def is_pid_alive(pid: int) -> bool:
+    # os.kill terminates the process on windows, rely on the pin age there
+    if sys.platform == "win32":
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def load_pinned_path_lst() -> list[str]:
+    pinned_path_lst = []
+
+    pin_dirpath = Path(PIN_DIRPATH)
+
+    if not pin_dirpath.is_dir():
+        return pinned_path_lst
+
+    for pin_filepath in pin_dirpath.glob("*.json"):
+        try:
+            pin_age = time.time() - pin_filepath.stat().st_mtime
+
+            with open(pin_filepath, encoding="utf-8") as f:
+                pin = json.load(f)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+
+        if pin_age > get_pin_max_age() or not is_pid_alive(pin["pid"]):
+            print(f"info: removing stale pin {pin_filepath}")
+            pin_filepath.unlink(missing_ok=True)
+            continue
+
+        pinned_path_lst.extend(pin["path_lst"])
+
+    return pinned_path_lst
+
+
+def is_path_pinned(key: str, pinned_path_lst: list[str]) -> bool:
+    for pinned_path in pinned_path_lst:
+        if key == pinned_path or key.startswith(pinned_path.rstrip("/") + "/"):
+            return True
+
+    return False
+
+
+@dataclass
+class CacheEntry:
+    size: int
+    access_time: float
+    key_lst: list[str] = field(default_factory=list)
+
+
+def scan_cache_dir(
+    dirpath: Path, access_index: dict[str, float]
+) -> dict[tuple[int, int], CacheEntry]:
+    # hardlinks to the same blob only free space once every link is gone
+    entry_dict: dict[tuple[int, int], CacheEntry] = {}
+
+    pin_dirpath = Path(PIN_DIRPATH).resolve()
+
+    for root, dirname_lst, filename_lst in os.walk(dirpath):
+        if Path(root).resolve() == pin_dirpath:
+            dirname_lst.clear()
+            continue
+
+        for filename in filename_lst:
+            if filename in GC_EXCLUDED_NAME_SET:
+                continue
+
+            filepath = Path(root, filename)
+
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                continue
+
+            key = get_access_key(filepath)
+
+            access_time = access_index.get(key, stat.st_mtime)
+
+            inode = (stat.st_dev, stat.st_ino)
+
+            if inode not in entry_dict:
+                entry_dict[inode] = CacheEntry(stat.st_size, access_time)
+
+            entry = entry_dict[inode]
+            entry.access_time = max(entry.access_time, access_time)
+            entry.key_lst.append(key)
+
+    return entry_dict
+
+
+@dataclass
+class GcReport:
+    dirpath: str
+    total_size: int = 0
+    reclaimed_size: int = 0
+    removed_file_count: int = 0
+    pinned_size: int = 0
+
+
+def gc_cache_dir(
+    dirpath: str,
+    budget: int,
+    access_index: dict[str, float],
+    pinned_path_lst: list[str],
+    dry_run=False,
+) -> GcReport:
+    report = GcReport(dirpath)
+
+    entry_dict = scan_cache_dir(Path(dirpath), access_index)
+
+    entry_lst = sorted(entry_dict.values(), key=lambda i: i.access_time)
+
+    report.total_size = sum(i.size for i in entry_lst)
+
+    remaining_size = report.total_size
+
+    for entry in entry_lst:
+        if remaining_size <= budget:
+            break
+
+        if any(is_path_pinned(key, pinned_path_lst) for key in entry.key_lst):
+            report.pinned_size += entry.size
+            continue
+
+        for key in entry.key_lst:
+            if not dry_run:
+                Path(key).unlink(missing_ok=True)
+                access_index.pop(key, None)
+
+            report.removed_file_count += 1
+
+        remaining_size -= entry.size
+        report.reclaimed_size += entry.size
+
+    return report
+
+
+def gc(
+    asset_budget: int | None = None, tmp_budget: int | None = None, dry_run=False
+) -> list[GcReport]:
+    if asset_budget is None:
+        asset_budget = config.get("asset_budget")
+
+    if tmp_budget is None:
+        tmp_budget = config.get("tmp_budget")
+
+    flush_access_index()
+
+    access_index = load_access_index()
+
+    pinned_path_lst = load_pinned_path_lst()
+
+    report_lst = []
+
+    for dirpath, budget in ((ASSET_DIRPATH, asset_budget), (TMP_DIRPATH, tmp_budget)):
+        if budget is None or not Path(dirpath).is_dir():
+            continue
+
+        report = gc_cache_dir(dirpath, budget, access_index, pinned_path_lst, dry_run)
+
+        print(
+            f"info: gc {report.dirpath}: {report.total_size} bytes in use, "
+            f"{report.reclaimed_size} bytes reclaimed from "
+            f"{report.removed_file_count} files, {report.pinned_size} bytes pinned"
+        )
+
+        report_lst.append(report)
+
+    if not dry_run:
+        save_access_index(access_index)
+
+    return report_lst
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="evict least recently used files from asset/ and tmp/"
+    )
+    parser.add_argument("--asset-budget", type=int, default=None)
+    parser.add_argument("--tmp-budget", type=int, default=None)
+    parser.add_argument("-n", "--dry-run", action="store_true")
+
+    args = parser.parse_args()
+
+    gc(args.asset_budget, args.tmp_budget, args.dry_run)
+
+
+atexit.register(flush_access_index)
+atexit.register(remove_pin)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import os
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+from .const import CODEC_CACHE_DIRPATH
+from .config import config
+
+
+# bump when the cached value format changes
+CODEC_CACHE_VERSION = 1
+
+DEFAULT_CODEC_CACHE_BUDGET = 1 << 30
+
+CODEC_CACHE_LOW_WATER = 0.9
+
+
+def get_codec_cache_budget() -> int:
+    return config.get("codec_cache_budget", DEFAULT_CODEC_CACHE_BUDGET)
+
+
+def get_codec_cache_key(tag: tuple, data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogateescape")
+
+    h = hashlib.sha256()
+    h.update(repr((CODEC_CACHE_VERSION, *tag)).encode("utf-8"))
+    h.update(b"\0")
+    h.update(data)
+
+    return h.hexdigest()
+
+
+def get_codec_cache_filepath(key: str) -> Path:
+    return Path(CODEC_CACHE_DIRPATH, f"{key}.pickle")
+
+
+def load_codec_cache(key: str):
+    cache_filepath = get_codec_cache_filepath(key)
+
+    try:
+        value = pickle.loads(cache_filepath.read_bytes())
+    except FileNotFoundError:
+        raise KeyError(key)
+    except Exception:
+        cache_filepath.unlink(missing_ok=True)
+        raise KeyError(key)
+
+    try:
+        os.utime(cache_filepath)
+    except OSError:
+        pass
+
+    return value
+
+
+def scan_codec_cache() -> list[tuple[float, int, str]]:
+    cache_lst = []
+
+    with os.scandir(CODEC_CACHE_DIRPATH) as it:
+        for entry in it:
+            if not entry.name.endswith(".pickle"):
+                continue
+
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            cache_lst.append((stat.st_mtime, stat.st_size, entry.path))
+
+    return cache_lst
+
+
+def evict_codec_cache(budget: int) -> int:
+    cache_lst = scan_codec_cache()
+
+    total_size = sum(size for _, size, _ in cache_lst)
+
+    # evict below the budget so the next few writes do not rescan
+    target_size = int(budget * CODEC_CACHE_LOW_WATER)
+
+    if total_size <= target_size:
+        return total_size
+
+    cache_lst.sort()
+
+    for _, size, path in cache_lst:
+        if total_size <= target_size:
+            break
+
+        Path(path).unlink(missing_ok=True)
+        total_size -= size
+
+    return total_size
+
+
+codec_cache_lock = threading.Lock()
+
+# tracked across writes, only rescanned on the first write and on eviction
+codec_cache_size: int | None = None
+
+
+def add_codec_cache_size(size_delta: int, budget: int):
+    global codec_cache_size
+
+    with codec_cache_lock:
+        if codec_cache_size is None:
+            codec_cache_size = sum(size for _, size, _ in scan_codec_cache())
+        else:
+            codec_cache_size += size_delta
+
+        if codec_cache_size > budget:
+            codec_cache_size = evict_codec_cache(budget)
+
+
+def save_codec_cache(key: str, value):
+    budget = get_codec_cache_budget()
+
+    value_bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    if len(value_bytes) > budget:
+        return
+
+    Path(CODEC_CACHE_DIRPATH).mkdir(parents=True, exist_ok=True)
+
+    cache_filepath = get_codec_cache_filepath(key)
+
+    try:
+        prev_size = cache_filepath.stat().st_size
+    except FileNotFoundError:
+        prev_size = 0
+
+    partial_filepath = cache_filepath.with_suffix(f".{uuid4()}.partial")
+    partial_filepath.write_bytes(value_bytes)
+    os.replace(partial_filepath, cache_filepath)
+
+    add_codec_cache_size(len(value_bytes) - prev_size, budget)
+
+
+def cached_codec(tag: tuple, data: bytes | str, func):
+    if get_codec_cache_budget() <= 0:
+        return func(data)
+
+    key = get_codec_cache_key(tag, data)
+
+    try:
+        return load_codec_cache(key)
+    except KeyError:
+        pass
+
+    value = func(data)
+
+    save_codec_cache(key, value)
+
+    return value
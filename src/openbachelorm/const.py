@@ -4,8 +4,47 @@ TMP_DIRPATH = "tmp/"
 
 ASSET_DIRPATH = "asset/"
 
+ASSET_STORE_DIRPATH = "asset/.store/"
+
 MOD_DIRPATH = "mod/"
 
+SHM_DIRPATH = "/dev/shm/"
+
+CODEC_CACHE_DIRPATH = "tmp/codec_cache/"
+
+PIN_DIRPATH = "tmp/.pin/"
+
+ACCESS_INDEX_FILEPATH = "asset/.access_index.json"
+
+BUILD_CACHE_DIRPATH = "tmp/build_cache/"
+
+
+class FlatcEngine(StrEnum):
+    PYTHON = "python"
+    FLATC = "flatc"
+
+
+class Downloader(StrEnum):
+    ARIA2C = "aria2c"
+    HTTP = "http"
+
+
+class AssetDatPolicy(StrEnum):
+    KEEP = "keep"
+    REMOVE = "remove"
+    ZIP = "zip"
+
+
+class FlatcScratch(StrEnum):
+    MEMORY = "memory"
+    DISK = "disk"
+
+
+class ModCompression(StrEnum):
+    AUTO = "auto"
+    STORED = "stored"
+    DEFLATE = "deflate"
+
 
 class KnownTable(StrEnum):
     ACTIVITY_TABLE = "activity_table"
@@ -0,0 +1,225 @@
+import http.client
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from .config import config
+
+
+DEFAULT_DOWNLOAD_RETRIES = 5
+
+DEFAULT_DOWNLOAD_BACKOFF = 1.0
+
+DEFAULT_DOWNLOAD_TIMEOUT = 60.0
+
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+def get_download_retries() -> int:
+    return config.get("download_retries", DEFAULT_DOWNLOAD_RETRIES)
+
+
+def get_download_backoff() -> float:
+    return config.get("download_backoff", DEFAULT_DOWNLOAD_BACKOFF)
+
+
+def get_download_timeout() -> float:
+    return config.get("download_timeout", DEFAULT_DOWNLOAD_TIMEOUT)
+
+
+class RetryableDownloadError(ConnectionError):
+    pass
+
+
+class HttpConnectionPool:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.idle_conn_dict: dict[
+            tuple[str, str], list[http.client.HTTPConnection]
+        ] = {}
+
+    def get_idle_conn(self, scheme: str, netloc: str):
+        with self.lock:
+            idle_conn_lst = self.idle_conn_dict.get((scheme, netloc))
+            if idle_conn_lst:
+                return idle_conn_lst.pop()
+
+        return None
+
+    def new_conn(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        match scheme:
+            case "https":
+                return http.client.HTTPSConnection(
+                    netloc, timeout=get_download_timeout()
+                )
+            case "http":
+                return http.client.HTTPConnection(
+                    netloc, timeout=get_download_timeout()
+                )
+            case _:
+                raise ValueError(f"unsupported scheme {scheme}")
+
+    def put_conn(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        with self.lock:
+            self.idle_conn_dict.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self):
+        with self.lock:
+            for idle_conn_lst in self.idle_conn_dict.values():
+                for conn in idle_conn_lst:
+                    conn.close()
+
+            self.idle_conn_dict.clear()
+
+
+http_connection_pool = HttpConnectionPool()
+
+
+def get_part_filepath(filepath: Path) -> Path:
+    return filepath.with_name(f"{filepath.name}.{uuid4()}.part")
+
+
+def get_validator_dict(resp: http.client.HTTPResponse) -> dict[str, str]:
+    validator_dict = {}
+
+    etag = resp.getheader("ETag")
+    if etag:
+        validator_dict["etag"] = etag
+
+    last_modified = resp.getheader("Last-Modified")
+    if last_modified:
+        validator_dict["last_modified"] = last_modified
+
+    return validator_dict
+
+
+def get_conditional_header_dict(validator_dict: dict[str, str]) -> dict[str, str]:
+    header_dict = {}
+
+    if "etag" in validator_dict:
+        header_dict["If-None-Match"] = validator_dict["etag"]
+
+    if "last_modified" in validator_dict:
+        header_dict["If-Modified-Since"] = validator_dict["last_modified"]
+
+    return header_dict
+
+
+def run_http_download(
+    url: str,
+    filepath: Path,
+    pool: HttpConnectionPool,
+    header_dict: dict[str, str],
+) -> dict[str, str] | None:
+    split_url = urlsplit(url)
+
+    target = split_url.path
+    if split_url.query:
+        target += f"?{split_url.query}"
+
+    # an idle connection may have been closed by the server in the meantime
+    while True:
+        conn = pool.get_idle_conn(split_url.scheme, split_url.netloc)
+        if conn is None:
+            break
+
+        try:
+            conn.request("GET", target, headers=header_dict)
+            resp = conn.getresponse()
+            break
+
+        except (OSError, http.client.HTTPException):
+            conn.close()
+
+    if conn is None:
+        conn = pool.new_conn(split_url.scheme, split_url.netloc)
+
+        try:
+            conn.request("GET", target, headers=header_dict)
+            resp = conn.getresponse()
+
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise RetryableDownloadError(f"failed to request {url}") from e
+
+    part_filepath = get_part_filepath(filepath)
+
+    try:
+        if resp.status == 304:
+            resp.read()
+
+            if resp.will_close:
+                conn.close()
+            else:
+                pool.put_conn(split_url.scheme, split_url.netloc, conn)
+
+            return None
+
+        if resp.status != 200:
+            resp.read()
+            conn.close()
+
+            if resp.status >= 500 or resp.status == 429:
+                raise RetryableDownloadError(f"{url} returned {resp.status}")
+
+            raise ConnectionError(f"{url} returned {resp.status}")
+
+        content_length = resp.length
+
+        try:
+            written_size = 0
+
+            with open(part_filepath, "wb") as f:
+                while chunk := resp.read(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written_size += len(chunk)
+
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise RetryableDownloadError(f"failed to read {url}") from e
+
+        # read() reports an early eof as a plain end of body
+        if content_length is not None and written_size != content_length:
+            conn.close()
+            raise RetryableDownloadError(
+                f"{url} ended after {written_size} of {content_length} bytes"
+            )
+
+        if resp.will_close:
+            conn.close()
+        else:
+            pool.put_conn(split_url.scheme, split_url.netloc, conn)
+
+        part_filepath.replace(filepath)
+
+        return get_validator_dict(resp)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def http_download_file(
+    url: str,
+    filepath: Path,
+    pool: HttpConnectionPool = http_connection_pool,
+    header_dict: dict[str, str] | None = None,
+) -> dict[str, str] | None:
+    if header_dict is None:
+        header_dict = {}
+
+    retries = get_download_retries()
+    backoff = get_download_backoff()
+
+    for attempt in range(retries + 1):
+        try:
+            return run_http_download(url, filepath, pool, header_dict)
+
+        except RetryableDownloadError as e:
+            if attempt >= retries:
+                raise ConnectionError(f"download_file failed to download {url}") from e
+
+            print(f"info: retrying {url}")
+
+            time.sleep(backoff * (1 << attempt))
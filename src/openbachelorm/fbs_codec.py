@@ -0,0 +1,888 @@
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+SCALAR_TYPE_DICT = {
+    "bool": ("B", 1),
+    "byte": ("b", 1),
+    "ubyte": ("B", 1),
+    "short": ("h", 2),
+    "ushort": ("H", 2),
+    "int": ("i", 4),
+    "uint": ("I", 4),
+    "long": ("q", 8),
+    "ulong": ("Q", 8),
+    "float": ("f", 4),
+    "double": ("d", 8),
+    "int8": ("b", 1),
+    "uint8": ("B", 1),
+    "int16": ("h", 2),
+    "uint16": ("H", 2),
+    "int32": ("i", 4),
+    "uint32": ("I", 4),
+    "int64": ("q", 8),
+    "uint64": ("Q", 8),
+    "float32": ("f", 4),
+    "float64": ("d", 8),
+}
+
+FLOAT_PRECISION_DICT = {
+    "f": 6,
+    "d": 12,
+}
+
+INT_RANGE_DICT = {
+    "b": (-(2**7), 2**7 - 1),
+    "B": (0, 2**8 - 1),
+    "h": (-(2**15), 2**15 - 1),
+    "H": (0, 2**16 - 1),
+    "i": (-(2**31), 2**31 - 1),
+    "I": (0, 2**32 - 1),
+    "q": (-(2**63), 2**63 - 1),
+    "Q": (0, 2**64 - 1),
+}
+
+UOFFSET_SIZE = 4
+
+
+@dataclass
+class FbsEnum:
+    name: str
+    base_type: str
+
+    value_dict: dict[str, int] = field(default_factory=dict)
+    name_dict: dict[int, str] = field(default_factory=dict)
+
+
+@dataclass
+class FbsField:
+    name: str
+    slot: int
+    type_name: str
+    is_vector: bool
+
+    default: str = ""
+    is_key: bool = False
+    is_deprecated: bool = False
+
+    enum: FbsEnum = None
+    table: "FbsTable" = None
+
+    # scalar fields only
+    code: str = ""
+    size: int = UOFFSET_SIZE
+    default_value: int | float = 0
+
+    @property
+    def voffset(self):
+        return 4 + 2 * self.slot
+
+    @property
+    def is_scalar(self):
+        return self.table is None and self.type_name != "string"
+
+
+@dataclass
+class FbsTable:
+    name: str
+
+    field_lst: list[FbsField] = field(default_factory=list)
+    field_dict: dict[str, FbsField] = field(default_factory=dict)
+
+    key_field: FbsField = None
+
+
+@dataclass
+class FbsSchema:
+    table_dict: dict[str, FbsTable] = field(default_factory=dict)
+    enum_dict: dict[str, FbsEnum] = field(default_factory=dict)
+
+    root_table: FbsTable = None
+
+    def decode(self, buf: bytes):
+        try:
+            return FbsDecoder(buf).read_root(self.root_table)
+        except (struct.error, IndexError, UnicodeDecodeError, RecursionError) as e:
+            raise ValueError(f"malformed {self.root_table.name} buffer: {e}") from e
+
+    def encode(self, obj) -> bytes:
+        encoder = FbsEncoder()
+        return encoder.finish(encoder.write_table(self.root_table, obj))
+
+
+# ---------- schema parser ----------
+
+
+FBS_TOKEN_RE = re.compile(
+    r"""
+    (?P<comment>//[^\n]*)
+    | (?P<space>\s+)
+    | (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<number>[-+]?(?:
+        0[xX][0-9a-fA-F]+
+        | \d+\.?\d*(?:[eE][-+]?\d+)?
+        | \.\d+(?:[eE][-+]?\d+)?
+    ))
+    | (?P<ident>[A-Za-z_][A-Za-z0-9_.]*)
+    | (?P<punct>[{}\[\]():;,=])
+    """,
+    re.VERBOSE,
+)
+
+
+def tokenize_fbs(text: str) -> list[str]:
+    token_lst = []
+
+    pos = 0
+    while pos < len(text):
+        m = FBS_TOKEN_RE.match(text, pos)
+        if m is None:
+            raise ValueError(f"unexpected character {text[pos]!r} at {pos}")
+
+        pos = m.end()
+
+        if m.lastgroup in ("comment", "space"):
+            continue
+
+        token_lst.append(m.group())
+
+    return token_lst
+
+
+class FbsParser:
+    def __init__(self, text: str):
+        self.token_lst = tokenize_fbs(text)
+        self.pos = 0
+
+        self.schema = FbsSchema()
+        self.root_type_name = ""
+
+    def peek(self):
+        if self.pos >= len(self.token_lst):
+            return ""
+        return self.token_lst[self.pos]
+
+    def next(self):
+        token = self.peek()
+        if not token:
+            raise ValueError("unexpected end of schema")
+        self.pos += 1
+        return token
+
+    def expect(self, token: str):
+        actual = self.next()
+        if actual != token:
+            raise ValueError(f"expected {token!r}, got {actual!r}")
+
+    def skip_statement(self):
+        while self.next() != ";":
+            pass
+
+    def parse_attribute_dict(self):
+        attribute_dict = {}
+
+        if self.peek() != "(":
+            return attribute_dict
+
+        self.expect("(")
+
+        while self.peek() != ")":
+            name = self.next()
+            value = ""
+            if self.peek() == ":":
+                self.expect(":")
+                value = self.next()
+            attribute_dict[name] = value
+
+            if self.peek() == ",":
+                self.expect(",")
+
+        self.expect(")")
+
+        return attribute_dict
+
+    def parse_enum(self):
+        name = self.next()
+        self.expect(":")
+        base_type = self.next()
+
+        if base_type not in SCALAR_TYPE_DICT or base_type in ("float", "double"):
+            raise ValueError(f"unsupported enum base type {base_type} in {name}")
+
+        self.parse_attribute_dict()
+
+        fbs_enum = FbsEnum(name, base_type)
+
+        self.expect("{")
+
+        value = 0
+        while self.peek() != "}":
+            value_name = self.next()
+            if self.peek() == "=":
+                self.expect("=")
+                value = int(self.next(), 0)
+
+            fbs_enum.value_dict[value_name] = value
+            # flatc sorts enum values by (value, name) and prints the first
+            if (
+                value not in fbs_enum.name_dict
+                or value_name < fbs_enum.name_dict[value]
+            ):
+                fbs_enum.name_dict[value] = value_name
+
+            value += 1
+
+            if self.peek() == ",":
+                self.expect(",")
+
+        self.expect("}")
+
+        self.schema.enum_dict[name] = fbs_enum
+
+    def parse_table(self):
+        name = self.next()
+
+        self.parse_attribute_dict()
+
+        table = FbsTable(name)
+
+        self.expect("{")
+
+        while self.peek() != "}":
+            field_name = self.next()
+            self.expect(":")
+
+            is_vector = False
+            if self.peek() == "[":
+                self.expect("[")
+                is_vector = True
+                type_name = self.next()
+                self.expect("]")
+            else:
+                type_name = self.next()
+
+            default = ""
+            if self.peek() == "=":
+                self.expect("=")
+                default = self.next()
+
+            attribute_dict = self.parse_attribute_dict()
+
+            if "id" in attribute_dict:
+                raise ValueError(f"explicit field id unsupported in {name}")
+
+            self.expect(";")
+
+            fbs_field = FbsField(
+                name=field_name,
+                slot=len(table.field_lst),
+                type_name=type_name,
+                is_vector=is_vector,
+                default=default,
+                is_key="key" in attribute_dict,
+                is_deprecated="deprecated" in attribute_dict,
+            )
+
+            table.field_lst.append(fbs_field)
+            table.field_dict[field_name] = fbs_field
+
+            if fbs_field.is_key:
+                table.key_field = fbs_field
+
+        self.expect("}")
+
+        self.schema.table_dict[name] = table
+
+    def parse(self) -> FbsSchema:
+        while self.peek():
+            keyword = self.next()
+
+            match keyword:
+                case "table":
+                    self.parse_table()
+
+                case "enum":
+                    self.parse_enum()
+
+                case "root_type":
+                    self.root_type_name = self.next()
+                    self.expect(";")
+
+                case (
+                    "namespace"
+                    | "attribute"
+                    | "include"
+                    | "file_identifier"
+                    | "file_extension"
+                ):
+                    self.skip_statement()
+
+                case _:
+                    raise ValueError(f"unsupported schema keyword {keyword}")
+
+        self.resolve()
+
+        return self.schema
+
+    def resolve_default(self, fbs_field: FbsField):
+        if not fbs_field.default:
+            return 0
+
+        if (
+            fbs_field.enum is not None
+            and fbs_field.default in fbs_field.enum.value_dict
+        ):
+            return fbs_field.enum.value_dict[fbs_field.default]
+
+        if fbs_field.code in FLOAT_PRECISION_DICT:
+            return float(fbs_field.default)
+
+        if fbs_field.default in ("true", "false"):
+            return int(fbs_field.default == "true")
+
+        return int(fbs_field.default, 0)
+
+    def resolve(self):
+        for table in self.schema.table_dict.values():
+            for fbs_field in table.field_lst:
+                type_name = fbs_field.type_name
+
+                if type_name in self.schema.enum_dict:
+                    fbs_field.enum = self.schema.enum_dict[type_name]
+                    type_name = fbs_field.enum.base_type
+
+                if type_name in self.schema.table_dict:
+                    fbs_field.table = self.schema.table_dict[type_name]
+
+                elif type_name in SCALAR_TYPE_DICT:
+                    fbs_field.code, fbs_field.size = SCALAR_TYPE_DICT[type_name]
+                    fbs_field.default_value = self.resolve_default(fbs_field)
+
+                elif type_name != "string":
+                    raise ValueError(
+                        f"unknown type {fbs_field.type_name} in {table.name}"
+                    )
+
+                # vectors and non-scalars are always stored as offsets
+                if fbs_field.is_vector or not fbs_field.is_scalar:
+                    fbs_field.size = UOFFSET_SIZE
+
+        if self.root_type_name not in self.schema.table_dict:
+            raise ValueError(f"root_type {self.root_type_name} not found")
+
+        self.schema.root_table = self.schema.table_dict[self.root_type_name]
+
+
+def parse_fbs_schema(text: str) -> FbsSchema:
+    return FbsParser(text).parse()
+
+
+def load_fbs_schema(fbs_filepath: Path) -> FbsSchema:
+    return parse_fbs_schema(fbs_filepath.read_text("utf-8"))
+
+
+# ---------- decoder ----------
+
+
+INT32 = struct.Struct("<i")
+UINT32 = struct.Struct("<I")
+UINT16 = struct.Struct("<H")
+
+
+def format_float(value: float, code: str):
+    # flatc prints floats in fixed notation, 6 digits for float, 12 for double
+    if value != value or value in (float("inf"), float("-inf")):
+        return value
+    return float(f"{value:.{FLOAT_PRECISION_DICT[code]}f}")
+
+
+class FbsDecoder:
+    def __init__(self, buf: bytes):
+        self.buf = buf
+
+    def read_root(self, table: FbsTable):
+        return self.read_table(table, UINT32.unpack_from(self.buf, 0)[0])
+
+    def read_scalar(self, fbs_field: FbsField, value):
+        if fbs_field.type_name == "bool":
+            return value != 0
+
+        if fbs_field.code in FLOAT_PRECISION_DICT:
+            return format_float(value, fbs_field.code)
+
+        if fbs_field.enum is not None:
+            return fbs_field.enum.name_dict.get(value, value)
+
+        return value
+
+    def read_string(self, pos: int):
+        buf = self.buf
+        pos += UINT32.unpack_from(buf, pos)[0]
+        length = UINT32.unpack_from(buf, pos)[0]
+        pos += UOFFSET_SIZE
+        if pos + length > len(buf):
+            raise IndexError("string out of range")
+        return str(buf[pos : pos + length], "utf-8")
+
+    def read_vector(self, fbs_field: FbsField, pos: int):
+        buf = self.buf
+        pos += UINT32.unpack_from(buf, pos)[0]
+        length = UINT32.unpack_from(buf, pos)[0]
+        pos += UOFFSET_SIZE
+
+        if fbs_field.is_scalar:
+            value_lst = struct.unpack_from(f"<{length}{fbs_field.code}", buf, pos)
+            return [self.read_scalar(fbs_field, i) for i in value_lst]
+
+        if fbs_field.table is not None:
+            table = fbs_field.table
+            return [
+                self.read_table(table, i + UINT32.unpack_from(buf, i)[0])
+                for i in range(pos, pos + UOFFSET_SIZE * length, UOFFSET_SIZE)
+            ]
+
+        return [
+            self.read_string(i)
+            for i in range(pos, pos + UOFFSET_SIZE * length, UOFFSET_SIZE)
+        ]
+
+    def get_field_pos(self, fbs_field: FbsField, pos: int) -> int:
+        buf = self.buf
+
+        vtable_pos = pos - INT32.unpack_from(buf, pos)[0]
+
+        if fbs_field.voffset >= UINT16.unpack_from(buf, vtable_pos)[0]:
+            return 0
+
+        field_offset = UINT16.unpack_from(buf, vtable_pos + fbs_field.voffset)[0]
+
+        if not field_offset:
+            return 0
+
+        return pos + field_offset
+
+    def read_table_vector_item_pos(self, vector_pos: int, idx: int) -> int:
+        pos = vector_pos + UOFFSET_SIZE * idx
+        return pos + UINT32.unpack_from(self.buf, pos)[0]
+
+    def read_table_vector_column_lst(
+        self,
+        vector_pos: int,
+        length: int,
+        fbs_field_lst: list[FbsField],
+        default_lst: list,
+    ) -> list[list]:
+        buf = self.buf
+        read_uint32 = UINT32.unpack_from
+        read_int32 = INT32.unpack_from
+        read_uint16 = UINT16.unpack_from
+        buf_length = len(buf)
+
+        # strings and plain scalars are read inline, the rest via read_field
+        reader_lst = []
+        for fbs_field in fbs_field_lst:
+            if fbs_field.is_vector or fbs_field.table is not None:
+                reader_lst.append(None)
+            elif fbs_field.type_name == "string":
+                reader_lst.append("string")
+            elif (
+                fbs_field.type_name == "bool"
+                or fbs_field.code in FLOAT_PRECISION_DICT
+                or fbs_field.enum is not None
+            ):
+                reader_lst.append(None)
+            else:
+                reader_lst.append(struct.Struct(f"<{fbs_field.code}").unpack_from)
+
+        column_plan = [
+            (fbs_field.voffset // 2, reader, fbs_field, default, [])
+            for fbs_field, reader, default in zip(
+                fbs_field_lst, reader_lst, default_lst
+            )
+        ]
+
+        # the whole vtable is unpacked at once, keyed by its byte size
+        vtable_reader_dict = {}
+
+        for idx in range(length):
+            item_pos = vector_pos + UOFFSET_SIZE * idx
+            pos = item_pos + read_uint32(buf, item_pos)[0]
+
+            vtable_pos = pos - read_int32(buf, pos)[0]
+            vtable_size = read_uint16(buf, vtable_pos)[0]
+
+            vtable_reader = vtable_reader_dict.get(vtable_size)
+            if vtable_reader is None:
+                vtable_reader = struct.Struct(f"<{vtable_size // 2}H").unpack_from
+                vtable_reader_dict[vtable_size] = vtable_reader
+
+            vtable = vtable_reader(buf, vtable_pos)
+            vtable_length = len(vtable)
+
+            for vtable_idx, reader, fbs_field, default, column in column_plan:
+                field_offset = vtable[vtable_idx] if vtable_idx < vtable_length else 0
+
+                if not field_offset:
+                    column.append(default)
+                    continue
+
+                field_pos = pos + field_offset
+
+                if reader == "string":
+                    str_pos = field_pos + read_uint32(buf, field_pos)[0]
+                    str_length = read_uint32(buf, str_pos)[0]
+                    str_pos += UOFFSET_SIZE
+                    if str_pos + str_length > buf_length:
+                        raise IndexError("string out of range")
+                    column.append(str(buf[str_pos : str_pos + str_length], "utf-8"))
+                elif reader is not None:
+                    column.append(reader(buf, field_pos)[0])
+                else:
+                    column.append(self.read_field(fbs_field, field_pos))
+
+        return [column for *_, column in column_plan]
+
+    def read_vector_header(self, field_pos: int) -> tuple[int, int]:
+        pos = field_pos + UINT32.unpack_from(self.buf, field_pos)[0]
+        return pos + UOFFSET_SIZE, UINT32.unpack_from(self.buf, pos)[0]
+
+    def read_table(self, table: FbsTable, pos: int):
+        buf = self.buf
+
+        vtable_pos = pos - INT32.unpack_from(buf, pos)[0]
+        vtable_size = UINT16.unpack_from(buf, vtable_pos)[0]
+
+        obj = {}
+
+        for fbs_field in table.field_lst:
+            voffset = fbs_field.voffset
+            if voffset < vtable_size:
+                field_offset = UINT16.unpack_from(buf, vtable_pos + voffset)[0]
+            else:
+                field_offset = 0
+
+            if fbs_field.is_deprecated:
+                continue
+
+            if not field_offset:
+                # flatc always prints scalar keys, even when left at default
+                if fbs_field.is_key and fbs_field.is_scalar:
+                    obj[fbs_field.name] = self.read_scalar(
+                        fbs_field, fbs_field.default_value
+                    )
+                continue
+
+            obj[fbs_field.name] = self.read_field(fbs_field, pos + field_offset)
+
+        return obj
+
+    def read_field(self, fbs_field: FbsField, field_pos: int):
+        if fbs_field.is_vector:
+            return self.read_vector(fbs_field, field_pos)
+
+        if fbs_field.table is not None:
+            return self.read_table(
+                fbs_field.table,
+                field_pos + UINT32.unpack_from(self.buf, field_pos)[0],
+            )
+
+        if fbs_field.type_name == "string":
+            return self.read_string(field_pos)
+
+        return self.read_scalar(
+            fbs_field,
+            struct.unpack_from(f"<{fbs_field.code}", self.buf, field_pos)[0],
+        )
+
+
+# ---------- encoder ----------
+
+
+def simple_qsort(item_lst: list, less):
+    # same (unstable) partitioning as flatc's SimpleQsort, so vectors with
+    # duplicate keys come out in the same order flatc would produce
+    stack = [(0, len(item_lst))]
+
+    while stack:
+        begin, end = stack.pop()
+        if end - begin <= 1:
+            continue
+
+        left = begin + 1
+        right = end
+        while left < right:
+            if less(item_lst[begin], item_lst[left]):
+                right -= 1
+                item_lst[left], item_lst[right] = item_lst[right], item_lst[left]
+            else:
+                left += 1
+
+        left -= 1
+        item_lst[begin], item_lst[left] = item_lst[left], item_lst[begin]
+
+        stack.append((right, end))
+        stack.append((begin, left))
+
+
+class FbsEncoder:
+    # mirrors flatbuffers::FlatBufferBuilder as driven by the flatc json
+    # parser; the buffer is kept back to front in self.rev
+    def __init__(self):
+        self.rev = bytearray()
+        self.minalign = 1
+
+        self.vtable_dict: dict[tuple, int] = {}
+
+        self.field_loc_lst: list[tuple[int, int]] = []
+        self.max_voffset = 0
+
+    def get_size(self):
+        return len(self.rev)
+
+    def align(self, size: int):
+        if size > self.minalign:
+            self.minalign = size
+        self.rev += bytes(-len(self.rev) % size)
+
+    def pre_align(self, length: int, alignment: int):
+        if not length:
+            return
+        if alignment > self.minalign:
+            self.minalign = alignment
+        self.rev += bytes(-(len(self.rev) + length) % alignment)
+
+    def push_scalar(self, code: str, value):
+        self.align(struct.calcsize(code))
+        self.rev += struct.pack(f">{code}", value)
+        return len(self.rev)
+
+    def push_offset(self, off: int):
+        self.align(UOFFSET_SIZE)
+        self.rev += struct.pack(">I", len(self.rev) - off + UOFFSET_SIZE)
+        return len(self.rev)
+
+    def create_string(self, s: str):
+        try:
+            data = s.encode("utf-8")
+        except UnicodeEncodeError as e:
+            raise ValueError(f"illegal unicode sequence in {s!r}") from e
+
+        self.pre_align(len(data) + 1, UOFFSET_SIZE)
+        self.rev.append(0)
+        self.rev += data[::-1]
+        return self.push_scalar("I", len(data))
+
+    def start_vector(self, length: int, elem_size: int):
+        self.pre_align(length * elem_size, UOFFSET_SIZE)
+        self.pre_align(length * elem_size, elem_size)
+
+    def end_vector(self, length: int):
+        return self.push_scalar("I", length)
+
+    def create_scalar_vector(self, code: str, value_lst: list):
+        elem_size = struct.calcsize(code)
+        self.start_vector(len(value_lst), elem_size)
+        self.rev += struct.pack(f">{len(value_lst)}{code}", *reversed(value_lst))
+        return self.end_vector(len(value_lst))
+
+    def create_offset_vector(self, off_lst: list[int]):
+        self.start_vector(len(off_lst), UOFFSET_SIZE)
+        for off in reversed(off_lst):
+            self.push_offset(off)
+        return self.end_vector(len(off_lst))
+
+    def start_table(self):
+        self.field_loc_lst = []
+        self.max_voffset = 0
+        return len(self.rev)
+
+    def track_field(self, voffset: int, off: int):
+        self.field_loc_lst.append((voffset, off))
+        if voffset > self.max_voffset:
+            self.max_voffset = voffset
+
+    def end_table(self, start: int):
+        vtable_offset_loc = self.push_scalar("i", 0)
+
+        vtable_size = max(self.max_voffset + 2, 4)
+        vtable = [0] * (vtable_size // 2)
+        vtable[0] = vtable_size
+        vtable[1] = vtable_offset_loc - start
+        for voffset, off in self.field_loc_lst:
+            vtable[voffset // 2] = vtable_offset_loc - off
+        vtable = tuple(vtable)
+
+        vtable_loc = self.vtable_dict.get(vtable)
+        if vtable_loc is None:
+            self.rev += struct.pack(f">{len(vtable)}H", *reversed(vtable))
+            vtable_loc = len(self.rev)
+            self.vtable_dict[vtable] = vtable_loc
+
+        self.rev[vtable_offset_loc - 4 : vtable_offset_loc] = struct.pack(
+            ">i", vtable_loc - vtable_offset_loc
+        )
+
+        return vtable_offset_loc
+
+    def finish(self, root: int) -> bytes:
+        self.pre_align(UOFFSET_SIZE, self.minalign)
+        self.push_offset(root)
+        return bytes(self.rev[::-1])
+
+    def to_scalar(self, fbs_field: FbsField, value):
+        code = fbs_field.code
+
+        if isinstance(value, str):
+            if fbs_field.enum is not None and value in fbs_field.enum.value_dict:
+                return fbs_field.enum.value_dict[value]
+            try:
+                value = float(value) if code in FLOAT_PRECISION_DICT else int(value, 0)
+            except ValueError:
+                raise ValueError(
+                    f"invalid value {value!r} for {fbs_field.name}"
+                ) from None
+
+        if isinstance(value, bool):
+            if fbs_field.type_name != "bool":
+                raise ValueError(f"invalid value {value!r} for {fbs_field.name}")
+            return int(value)
+
+        if code in FLOAT_PRECISION_DICT:
+            if not isinstance(value, (int, float)):
+                raise ValueError(f"invalid value {value!r} for {fbs_field.name}")
+            value = float(value)
+            if code == "f" and abs(value) > 3.4028234663852886e38:
+                # flatc narrows out-of-range doubles to +-inf
+                try:
+                    struct.pack("<f", value)
+                except OverflowError:
+                    value = float("inf") if value > 0 else float("-inf")
+            return value
+
+        if not isinstance(value, int):
+            raise ValueError(f"invalid value {value!r} for {fbs_field.name}")
+
+        min_value, max_value = INT_RANGE_DICT[code]
+        if not min_value <= value <= max_value:
+            raise ValueError(
+                f"{value} does not fit [{min_value}; {max_value}] for {fbs_field.name}"
+            )
+
+        return value
+
+    def get_key(self, table: FbsTable, obj: dict):
+        key_field = table.key_field
+        value = obj.get(key_field.name)
+
+        if key_field.is_scalar:
+            if value is None:
+                return key_field.default_value
+            return self.to_scalar(key_field, value)
+
+        if value is None:
+            raise ValueError(
+                f"required field is missing: {key_field.name} in {table.name}"
+            )
+
+        return value.encode("utf-8")
+
+    def write_table_vector(self, table: FbsTable, obj_lst: list):
+        off_lst = [self.write_table(table, i) for i in obj_lst]
+
+        if table.key_field is None or len(off_lst) < 2:
+            return self.create_offset_vector(off_lst)
+
+        key_lst = [self.get_key(table, i) for i in obj_lst]
+
+        idx_lst = list(range(len(off_lst)))
+        if len(set(key_lst)) == len(key_lst):
+            idx_lst.sort(key=key_lst.__getitem__)
+        else:
+            simple_qsort(idx_lst, lambda a, b: key_lst[a] < key_lst[b])
+
+        return self.create_offset_vector([off_lst[i] for i in idx_lst])
+
+    def write_vector(self, fbs_field: FbsField, value_lst):
+        if not isinstance(value_lst, list):
+            raise ValueError(f"expected list for {fbs_field.name}")
+
+        if fbs_field.is_scalar:
+            return self.create_scalar_vector(
+                fbs_field.code,
+                [self.to_scalar(fbs_field, i) for i in value_lst],
+            )
+
+        if fbs_field.table is not None:
+            return self.write_table_vector(fbs_field.table, value_lst)
+
+        off_lst = []
+        for s in value_lst:
+            if not isinstance(s, str):
+                raise ValueError(f"expected string in {fbs_field.name}")
+            off_lst.append(self.create_string(s))
+
+        return self.create_offset_vector(off_lst)
+
+    def write_table(self, table: FbsTable, obj):
+        if not isinstance(obj, dict):
+            raise ValueError(f"expected object for {table.name}")
+
+        field_stack = []
+
+        for name, value in obj.items():
+            fbs_field = table.field_dict.get(name)
+            if fbs_field is None:
+                raise ValueError(f"unknown field: {name}")
+
+            if value is None:
+                continue
+
+            if fbs_field.is_vector:
+                value = self.write_vector(fbs_field, value)
+
+            elif fbs_field.table is not None:
+                value = self.write_table(fbs_field.table, value)
+
+            elif fbs_field.type_name == "string":
+                if not isinstance(value, str):
+                    raise ValueError(f"expected string for {name}")
+                value = self.create_string(value)
+
+            else:
+                value = self.to_scalar(fbs_field, value)
+
+            field_stack.append((fbs_field, value))
+
+        key_field = table.key_field
+        if (
+            key_field is not None
+            and not key_field.is_scalar
+            and obj.get(key_field.name) is None
+        ):
+            raise ValueError(
+                f"required field is missing: {key_field.name} in {table.name}"
+            )
+
+        # flatc keeps parsed fields sorted by slot, then lays them out
+        # largest first, last slot first
+        field_stack.sort(key=lambda i: i[0].slot)
+
+        start = self.start_table()
+
+        for size in (8, 4, 2, 1):
+            for fbs_field, value in reversed(field_stack):
+                if fbs_field.size != size:
+                    continue
+
+                if not fbs_field.is_scalar or fbs_field.is_vector:
+                    self.track_field(fbs_field.voffset, self.push_offset(value))
+
+                elif value != fbs_field.default_value:
+                    self.track_field(
+                        fbs_field.voffset,
+                        self.push_scalar(fbs_field.code, value),
+                    )
+
+        return self.end_table(start)
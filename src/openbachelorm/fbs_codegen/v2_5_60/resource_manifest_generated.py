@@ -0,0 +1,478 @@
+# automatically generated by the FlatBuffers compiler, do not modify
+
+# namespace: 
+
+import flatbuffers
+from flatbuffers.compat import import_numpy
+np = import_numpy()
+
+class clz_Torappu_Resource_ResourceManifest_BundleMeta(object):
+    __slots__ = ['_tab']
+
+    @classmethod
+    def GetRootAs(cls, buf, offset=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
+        x = clz_Torappu_Resource_ResourceManifest_BundleMeta()
+        x.Init(buf, n + offset)
+        return x
+
+    @classmethod
+    def GetRootAsclz_Torappu_Resource_ResourceManifest_BundleMeta(cls, buf, offset=0):
+        """This method is deprecated. Please switch to GetRootAs."""
+        return cls.GetRootAs(buf, offset)
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def Init(self, buf, pos):
+        self._tab = flatbuffers.table.Table(buf, pos)
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def Name(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        if o != 0:
+            return self._tab.String(o + self._tab.Pos)
+        return None
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def Props(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def SccIndex(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def AllDependencies(self, j):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        if o != 0:
+            a = self._tab.Vector(o)
+            return self._tab.Get(flatbuffers.number_types.Int32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def AllDependenciesAsNumpy(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        if o != 0:
+            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Int32Flags, o)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def AllDependenciesLength(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        if o != 0:
+            return self._tab.VectorLen(o)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMeta
+    def AllDependenciesIsNone(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        return o == 0
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaStart(builder):
+    builder.StartObject(4)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaAddName(builder, name):
+    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(name), 0)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaAddProps(builder, props):
+    builder.PrependInt32Slot(1, props, 0)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaAddSccIndex(builder, sccIndex):
+    builder.PrependInt32Slot(2, sccIndex, 0)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaAddAllDependencies(builder, allDependencies):
+    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(allDependencies), 0)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaStartAllDependenciesVector(builder, numElems):
+    return builder.StartVector(4, numElems, 4)
+
+def clz_Torappu_Resource_ResourceManifest_BundleMetaEnd(builder):
+    return builder.EndObject()
+
+
+try:
+    from typing import List
+except:
+    pass
+
+class clz_Torappu_Resource_ResourceManifest_BundleMetaT(object):
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMetaT
+    def __init__(
+        self,
+        name = None,
+        props = 0,
+        sccIndex = 0,
+        allDependencies = None,
+    ):
+        self.name = name  # type: Optional[str]
+        self.props = props  # type: int
+        self.sccIndex = sccIndex  # type: int
+        self.allDependencies = allDependencies  # type: Optional[List[int]]
+
+    @classmethod
+    def InitFromBuf(cls, buf, pos):
+        clzTorappuResourceResourceManifestBundleMeta = clz_Torappu_Resource_ResourceManifest_BundleMeta()
+        clzTorappuResourceResourceManifestBundleMeta.Init(buf, pos)
+        return cls.InitFromObj(clzTorappuResourceResourceManifestBundleMeta)
+
+    @classmethod
+    def InitFromPackedBuf(cls, buf, pos=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        return cls.InitFromBuf(buf, pos+n)
+
+    @classmethod
+    def InitFromObj(cls, clzTorappuResourceResourceManifestBundleMeta):
+        x = clz_Torappu_Resource_ResourceManifest_BundleMetaT()
+        x._UnPack(clzTorappuResourceResourceManifestBundleMeta)
+        return x
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMetaT
+    def _UnPack(self, clzTorappuResourceResourceManifestBundleMeta):
+        if clzTorappuResourceResourceManifestBundleMeta is None:
+            return
+        self.name = clzTorappuResourceResourceManifestBundleMeta.Name()
+        self.props = clzTorappuResourceResourceManifestBundleMeta.Props()
+        self.sccIndex = clzTorappuResourceResourceManifestBundleMeta.SccIndex()
+        if not clzTorappuResourceResourceManifestBundleMeta.AllDependenciesIsNone():
+            if np is None:
+                self.allDependencies = []
+                for i in range(clzTorappuResourceResourceManifestBundleMeta.AllDependenciesLength()):
+                    self.allDependencies.append(clzTorappuResourceResourceManifestBundleMeta.AllDependencies(i))
+            else:
+                self.allDependencies = clzTorappuResourceResourceManifestBundleMeta.AllDependenciesAsNumpy()
+
+    # clz_Torappu_Resource_ResourceManifest_BundleMetaT
+    def Pack(self, builder):
+        if self.name is not None:
+            name = builder.CreateString(self.name)
+        if self.allDependencies is not None:
+            if np is not None and type(self.allDependencies) is np.ndarray:
+                allDependencies = builder.CreateNumpyVector(self.allDependencies)
+            else:
+                clz_Torappu_Resource_ResourceManifest_BundleMetaStartAllDependenciesVector(builder, len(self.allDependencies))
+                for i in reversed(range(len(self.allDependencies))):
+                    builder.PrependInt32(self.allDependencies[i])
+                allDependencies = builder.EndVector()
+        clz_Torappu_Resource_ResourceManifest_BundleMetaStart(builder)
+        if self.name is not None:
+            clz_Torappu_Resource_ResourceManifest_BundleMetaAddName(builder, name)
+        clz_Torappu_Resource_ResourceManifest_BundleMetaAddProps(builder, self.props)
+        clz_Torappu_Resource_ResourceManifest_BundleMetaAddSccIndex(builder, self.sccIndex)
+        if self.allDependencies is not None:
+            clz_Torappu_Resource_ResourceManifest_BundleMetaAddAllDependencies(builder, allDependencies)
+        clzTorappuResourceResourceManifestBundleMeta = clz_Torappu_Resource_ResourceManifest_BundleMetaEnd(builder)
+        return clzTorappuResourceResourceManifestBundleMeta
+
+
+class clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta(object):
+    __slots__ = ['_tab']
+
+    @classmethod
+    def GetRootAs(cls, buf, offset=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
+        x = clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta()
+        x.Init(buf, n + offset)
+        return x
+
+    @classmethod
+    def GetRootAsclz_Torappu_Resource_ResourceManifest_AssetToBundleMeta(cls, buf, offset=0):
+        """This method is deprecated. Please switch to GetRootAs."""
+        return cls.GetRootAs(buf, offset)
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta
+    def Init(self, buf, pos):
+        self._tab = flatbuffers.table.Table(buf, pos)
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta
+    def AssetName(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        if o != 0:
+            return self._tab.String(o + self._tab.Pos)
+        return None
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta
+    def BundleIndex(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta
+    def Name(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        if o != 0:
+            return self._tab.String(o + self._tab.Pos)
+        return None
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta
+    def Path(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        if o != 0:
+            return self._tab.String(o + self._tab.Pos)
+        return None
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaStart(builder):
+    builder.StartObject(4)
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddAssetName(builder, assetName):
+    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(assetName), 0)
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddBundleIndex(builder, bundleIndex):
+    builder.PrependInt32Slot(1, bundleIndex, 0)
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddName(builder, name):
+    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(name), 0)
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddPath(builder, path):
+    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(path), 0)
+
+def clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaEnd(builder):
+    return builder.EndObject()
+
+
+
+class clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT(object):
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT
+    def __init__(
+        self,
+        assetName = None,
+        bundleIndex = 0,
+        name = None,
+        path = None,
+    ):
+        self.assetName = assetName  # type: Optional[str]
+        self.bundleIndex = bundleIndex  # type: int
+        self.name = name  # type: Optional[str]
+        self.path = path  # type: Optional[str]
+
+    @classmethod
+    def InitFromBuf(cls, buf, pos):
+        clzTorappuResourceResourceManifestAssetToBundleMeta = clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta()
+        clzTorappuResourceResourceManifestAssetToBundleMeta.Init(buf, pos)
+        return cls.InitFromObj(clzTorappuResourceResourceManifestAssetToBundleMeta)
+
+    @classmethod
+    def InitFromPackedBuf(cls, buf, pos=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        return cls.InitFromBuf(buf, pos+n)
+
+    @classmethod
+    def InitFromObj(cls, clzTorappuResourceResourceManifestAssetToBundleMeta):
+        x = clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT()
+        x._UnPack(clzTorappuResourceResourceManifestAssetToBundleMeta)
+        return x
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT
+    def _UnPack(self, clzTorappuResourceResourceManifestAssetToBundleMeta):
+        if clzTorappuResourceResourceManifestAssetToBundleMeta is None:
+            return
+        self.assetName = clzTorappuResourceResourceManifestAssetToBundleMeta.AssetName()
+        self.bundleIndex = clzTorappuResourceResourceManifestAssetToBundleMeta.BundleIndex()
+        self.name = clzTorappuResourceResourceManifestAssetToBundleMeta.Name()
+        self.path = clzTorappuResourceResourceManifestAssetToBundleMeta.Path()
+
+    # clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT
+    def Pack(self, builder):
+        if self.assetName is not None:
+            assetName = builder.CreateString(self.assetName)
+        if self.name is not None:
+            name = builder.CreateString(self.name)
+        if self.path is not None:
+            path = builder.CreateString(self.path)
+        clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaStart(builder)
+        if self.assetName is not None:
+            clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddAssetName(builder, assetName)
+        clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddBundleIndex(builder, self.bundleIndex)
+        if self.name is not None:
+            clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddName(builder, name)
+        if self.path is not None:
+            clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaAddPath(builder, path)
+        clzTorappuResourceResourceManifestAssetToBundleMeta = clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaEnd(builder)
+        return clzTorappuResourceResourceManifestAssetToBundleMeta
+
+
+class clz_Torappu_Resource_ResourceManifest(object):
+    __slots__ = ['_tab']
+
+    @classmethod
+    def GetRootAs(cls, buf, offset=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
+        x = clz_Torappu_Resource_ResourceManifest()
+        x.Init(buf, n + offset)
+        return x
+
+    @classmethod
+    def GetRootAsclz_Torappu_Resource_ResourceManifest(cls, buf, offset=0):
+        """This method is deprecated. Please switch to GetRootAs."""
+        return cls.GetRootAs(buf, offset)
+    # clz_Torappu_Resource_ResourceManifest
+    def Init(self, buf, pos):
+        self._tab = flatbuffers.table.Table(buf, pos)
+
+    # clz_Torappu_Resource_ResourceManifest
+    def RawCount(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        if o != 0:
+            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest
+    def Bundles(self, j):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        if o != 0:
+            x = self._tab.Vector(o)
+            x += flatbuffers.number_types.UOffsetTFlags.py_type(j) * 4
+            x = self._tab.Indirect(x)
+            obj = clz_Torappu_Resource_ResourceManifest_BundleMeta()
+            obj.Init(self._tab.Bytes, x)
+            return obj
+        return None
+
+    # clz_Torappu_Resource_ResourceManifest
+    def BundlesLength(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        if o != 0:
+            return self._tab.VectorLen(o)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest
+    def BundlesIsNone(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        return o == 0
+
+    # clz_Torappu_Resource_ResourceManifest
+    def AssetToBundleList(self, j):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        if o != 0:
+            x = self._tab.Vector(o)
+            x += flatbuffers.number_types.UOffsetTFlags.py_type(j) * 4
+            x = self._tab.Indirect(x)
+            obj = clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta()
+            obj.Init(self._tab.Bytes, x)
+            return obj
+        return None
+
+    # clz_Torappu_Resource_ResourceManifest
+    def AssetToBundleListLength(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        if o != 0:
+            return self._tab.VectorLen(o)
+        return 0
+
+    # clz_Torappu_Resource_ResourceManifest
+    def AssetToBundleListIsNone(self):
+        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        return o == 0
+
+def clz_Torappu_Resource_ResourceManifestStart(builder):
+    builder.StartObject(3)
+
+def clz_Torappu_Resource_ResourceManifestAddRawCount(builder, rawCount):
+    builder.PrependInt32Slot(0, rawCount, 0)
+
+def clz_Torappu_Resource_ResourceManifestAddBundles(builder, bundles):
+    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(bundles), 0)
+
+def clz_Torappu_Resource_ResourceManifestStartBundlesVector(builder, numElems):
+    return builder.StartVector(4, numElems, 4)
+
+def clz_Torappu_Resource_ResourceManifestAddAssetToBundleList(builder, assetToBundleList):
+    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(assetToBundleList), 0)
+
+def clz_Torappu_Resource_ResourceManifestStartAssetToBundleListVector(builder, numElems):
+    return builder.StartVector(4, numElems, 4)
+
+def clz_Torappu_Resource_ResourceManifestEnd(builder):
+    return builder.EndObject()
+
+
+try:
+    from typing import List
+except:
+    pass
+
+class clz_Torappu_Resource_ResourceManifestT(object):
+
+    # clz_Torappu_Resource_ResourceManifestT
+    def __init__(
+        self,
+        rawCount = 0,
+        bundles = None,
+        assetToBundleList = None,
+    ):
+        self.rawCount = rawCount  # type: int
+        self.bundles = bundles  # type: Optional[List[clz_Torappu_Resource_ResourceManifest_BundleMetaT]]
+        self.assetToBundleList = assetToBundleList  # type: Optional[List[clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT]]
+
+    @classmethod
+    def InitFromBuf(cls, buf, pos):
+        clzTorappuResourceResourceManifest = clz_Torappu_Resource_ResourceManifest()
+        clzTorappuResourceResourceManifest.Init(buf, pos)
+        return cls.InitFromObj(clzTorappuResourceResourceManifest)
+
+    @classmethod
+    def InitFromPackedBuf(cls, buf, pos=0):
+        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        return cls.InitFromBuf(buf, pos+n)
+
+    @classmethod
+    def InitFromObj(cls, clzTorappuResourceResourceManifest):
+        x = clz_Torappu_Resource_ResourceManifestT()
+        x._UnPack(clzTorappuResourceResourceManifest)
+        return x
+
+    # clz_Torappu_Resource_ResourceManifestT
+    def _UnPack(self, clzTorappuResourceResourceManifest):
+        if clzTorappuResourceResourceManifest is None:
+            return
+        self.rawCount = clzTorappuResourceResourceManifest.RawCount()
+        if not clzTorappuResourceResourceManifest.BundlesIsNone():
+            self.bundles = []
+            for i in range(clzTorappuResourceResourceManifest.BundlesLength()):
+                if clzTorappuResourceResourceManifest.Bundles(i) is None:
+                    self.bundles.append(None)
+                else:
+                    clz_Torappu_Resource_ResourceManifest_BundleMeta_ = clz_Torappu_Resource_ResourceManifest_BundleMetaT.InitFromObj(clzTorappuResourceResourceManifest.Bundles(i))
+                    self.bundles.append(clz_Torappu_Resource_ResourceManifest_BundleMeta_)
+        if not clzTorappuResourceResourceManifest.AssetToBundleListIsNone():
+            self.assetToBundleList = []
+            for i in range(clzTorappuResourceResourceManifest.AssetToBundleListLength()):
+                if clzTorappuResourceResourceManifest.AssetToBundleList(i) is None:
+                    self.assetToBundleList.append(None)
+                else:
+                    clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta_ = clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT.InitFromObj(clzTorappuResourceResourceManifest.AssetToBundleList(i))
+                    self.assetToBundleList.append(clz_Torappu_Resource_ResourceManifest_AssetToBundleMeta_)
+
+    # clz_Torappu_Resource_ResourceManifestT
+    def Pack(self, builder):
+        if self.bundles is not None:
+            bundleslist = []
+            for i in range(len(self.bundles)):
+                bundleslist.append(self.bundles[i].Pack(builder))
+            clz_Torappu_Resource_ResourceManifestStartBundlesVector(builder, len(self.bundles))
+            for i in reversed(range(len(self.bundles))):
+                builder.PrependUOffsetTRelative(bundleslist[i])
+            bundles = builder.EndVector()
+        if self.assetToBundleList is not None:
+            assetToBundleListlist = []
+            for i in range(len(self.assetToBundleList)):
+                assetToBundleListlist.append(self.assetToBundleList[i].Pack(builder))
+            clz_Torappu_Resource_ResourceManifestStartAssetToBundleListVector(builder, len(self.assetToBundleList))
+            for i in reversed(range(len(self.assetToBundleList))):
+                builder.PrependUOffsetTRelative(assetToBundleListlist[i])
+            assetToBundleList = builder.EndVector()
+        clz_Torappu_Resource_ResourceManifestStart(builder)
+        clz_Torappu_Resource_ResourceManifestAddRawCount(builder, self.rawCount)
+        if self.bundles is not None:
+            clz_Torappu_Resource_ResourceManifestAddBundles(builder, bundles)
+        if self.assetToBundleList is not None:
+            clz_Torappu_Resource_ResourceManifestAddAssetToBundleList(builder, assetToBundleList)
+        clzTorappuResourceResourceManifest = clz_Torappu_Resource_ResourceManifestEnd(builder)
+        return clzTorappuResourceResourceManifest
+
+
@@ -1,9 +1,15 @@
+import io
+import os
 import subprocess
+import threading
+import shutil
+import zlib
 from pathlib import Path
+from typing import BinaryIO
 from uuid import uuid4
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 import json
-from functools import wraps
+from functools import wraps, lru_cache
 import zipfile
 from zipfile import ZipFile
 
@@ -12,7 +18,28 @@ from Crypto.Util.Padding import pad, unpad
 import bson
 from packaging.version import Version
 
-from .const import TMP_DIRPATH, ASSET_DIRPATH, KnownTable
+from .const import (
+    TMP_DIRPATH,
+    ASSET_DIRPATH,
+    SHM_DIRPATH,
+    KnownTable,
+    FlatcEngine,
+    FlatcScratch,
+    Downloader,
+    AssetDatPolicy,
+    ModCompression,
+)
+from .config import config
+from .fbs_codec import FbsSchema, load_fbs_schema
+from .codec_cache import cached_codec
+from .downloader import (
+    http_download_file,
+    get_part_filepath,
+    get_conditional_header_dict,
+)
+from .verify import get_verify_record_filepath, verify_file
+from .cache_gc import record_access
+from .asset_store import is_asset_store_enabled, get_asset_store_filepath, link_asset
 
 
 ORIG_ASSET_URL_PREFIX = "https://ak.hycdn.cn/assetbundle/official/Android/assets"
@@ -38,11 +65,42 @@ def get_tmp_filepath():
     return tmp_filepath
 
 
+DEFAULT_DOWNLOAD_CONNECTIONS = 8
+
+
+def get_download_connections() -> int:
+    return config.get("download_connections", DEFAULT_DOWNLOAD_CONNECTIONS)
+
+
+# caps concurrent downloads across every thread of the process
+download_semaphore = threading.BoundedSemaphore(get_download_connections())
+
+
 def download_file(url: str, filepath: Path):
+    with download_semaphore:
+        run_download_file(url, filepath)
+
+
+def get_downloader() -> Downloader:
+    return Downloader(config.get("downloader", Downloader.ARIA2C))
+
+
+def run_download_file(url: str, filepath: Path):
     print(f"info: downloading {url}")
 
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    match get_downloader():
+        case Downloader.HTTP:
+            http_download_file(url, filepath)
+
+        case _:
+            run_aria2c_download(url, filepath)
+
+    print(f"info: {url} downloaded")
+
+
+def run_aria2c_download(url: str, filepath: Path):
     tmp_filepath = get_tmp_filepath()
 
     try:
@@ -62,8 +120,6 @@ def download_file(url: str, filepath: Path):
 
         tmp_filepath.replace(filepath)
 
-        print(f"info: {url} downloaded")
-
     finally:
         remove_aria2_tmp(tmp_filepath)
 
@@ -84,34 +140,430 @@ def get_asset_filepath(res_version: str, asset_rel_filepath_str: str):
     return Path(ASSET_DIRPATH) / res_version / asset_rel_filepath_str
 
 
+def get_asset_dat_policy() -> AssetDatPolicy:
+    return AssetDatPolicy(config.get("asset_dat_policy", AssetDatPolicy.KEEP))
+
+
+@lru_cache
+def get_ab_info_dict(res_version: str) -> dict[str, dict]:
+    with open(download_hot_update_list(res_version), encoding="utf-8") as f:
+        hot_update_list = json.load(f)
+
+    return {ab_info["name"]: ab_info for ab_info in hot_update_list["abInfos"]}
+
+
+def get_ab_content_key(ab_info: dict) -> str:
+    return ab_info.get("md5") or ab_info.get("hash") or ""
+
+
+@lru_cache
+def get_pack_info_dict(res_version: str) -> dict[str, dict]:
+    with open(download_hot_update_list(res_version), encoding="utf-8") as f:
+        hot_update_list = json.load(f)
+
+    return {
+        pack_info["name"]: pack_info
+        for pack_info in hot_update_list.get("packInfos", [])
+    }
+
+
+@lru_cache
+def get_pack_member_dict(res_version: str) -> dict[str, list[str]]:
+    pack_info_dict = get_pack_info_dict(res_version)
+
+    pack_member_dict: dict[str, list[str]] = {}
+
+    for ab_name, ab_info in get_ab_info_dict(res_version).items():
+        # only packs listed in packInfos can be downloaded
+        pack_name = ab_info.get("pid")
+        if pack_name not in pack_info_dict:
+            continue
+
+        pack_member_dict.setdefault(pack_name, []).append(ab_name)
+
+    return pack_member_dict
+
+
+def get_asset_md5(res_version: str, asset_rel_filepath_str: str) -> str | None:
+    if not is_asset_store_enabled():
+        return None
+
+    ab_info = get_ab_info_dict(res_version).get(asset_rel_filepath_str)
+
+    if ab_info is None:
+        return None
+
+    return ab_info.get("md5") or None
+
+
+def get_asset_dat_filepath(res_version: str, asset_rel_filepath_str: str) -> Path:
+    return get_asset_filepath(res_version, asset_rel_filepath_str).with_suffix(".dat")
+
+
+def remove_asset_dat(res_version: str, asset_rel_filepath_str: str):
+    get_asset_dat_filepath(res_version, asset_rel_filepath_str).unlink(missing_ok=True)
+
+    md5 = get_asset_md5(res_version, asset_rel_filepath_str)
+
+    if md5 is not None:
+        get_asset_store_filepath(md5, ".dat").unlink(missing_ok=True)
+
+
+def is_asset_dat_size_ok(
+    res_version: str, asset_rel_filepath_str: str, asset_dat_filepath: Path
+) -> bool:
+    ab_info = get_ab_info_dict(res_version).get(asset_rel_filepath_str)
+
+    if ab_info is None or ab_info.get("totalSize") is None:
+        return True
+
+    return asset_dat_filepath.stat().st_size == ab_info["totalSize"]
+
+
+def download_asset_dat(res_version: str, asset_rel_filepath_str: str) -> Path:
+    asset_rel_filepath = Path(asset_rel_filepath_str)
+
+    asset_dat_filepath = get_asset_dat_filepath(res_version, asset_rel_filepath_str)
+
+    record_access(asset_dat_filepath)
+
+    if asset_dat_filepath.is_file():
+        # a leftover of an interrupted run is fetched again
+        if is_asset_dat_size_ok(
+            res_version, asset_rel_filepath_str, asset_dat_filepath
+        ):
+            return asset_dat_filepath
+
+        print(f"info: {asset_dat_filepath} size mismatch")
+
+        remove_asset_dat(res_version, asset_rel_filepath_str)
+
+    asset_dat_url = get_asset_dat_url(res_version, asset_rel_filepath)
+
+    md5 = get_asset_md5(res_version, asset_rel_filepath_str)
+
+    if md5 is None:
+        download_file(asset_dat_url, asset_dat_filepath)
+
+        return asset_dat_filepath
+
+    blob_dat_filepath = get_asset_store_filepath(md5, ".dat")
+
+    if not blob_dat_filepath.is_file():
+        download_file(asset_dat_url, blob_dat_filepath)
+
+    link_asset(blob_dat_filepath, asset_dat_filepath)
+
+    return asset_dat_filepath
+
+
+CORRUPT_ASSET_DAT_ERROR_TUPLE = (zipfile.BadZipFile, zlib.error, EOFError)
+
+
+def run_asset_dat_func(res_version: str, asset_rel_filepath_str: str, func):
+    asset_dat_filepath = download_asset_dat(res_version, asset_rel_filepath_str)
+
+    try:
+        return func(asset_dat_filepath)
+
+    except CORRUPT_ASSET_DAT_ERROR_TUPLE as e:
+        print(f"info: {asset_dat_filepath} is corrupt, downloading again: {e}")
+
+    remove_asset_dat(res_version, asset_rel_filepath_str)
+
+    return func(download_asset_dat(res_version, asset_rel_filepath_str))
+
+
+EXTRACT_CHUNK_SIZE = 1 << 20
+
+
+def extract_asset_dat(asset_dat_filepath: Path, member: str, asset_filepath: Path):
+    part_filepath = get_part_filepath(asset_filepath)
+
+    try:
+        with (
+            ZipFile(asset_dat_filepath) as zf,
+            zf.open(member) as src,
+            open(part_filepath, "wb") as dst,
+        ):
+            shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+        part_filepath.replace(asset_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
 def download_asset(res_version: str, asset_rel_filepath_str: str) -> Path:
     asset_rel_filepath = Path(asset_rel_filepath_str)
 
     asset_filepath = get_asset_filepath(res_version, asset_rel_filepath_str)
 
+    record_access(asset_filepath)
+
     if asset_filepath.is_file():
         return asset_filepath
 
-    asset_filepath.parent.mkdir(parents=True, exist_ok=True)
+    md5 = get_asset_md5(res_version, asset_rel_filepath_str)
 
-    asset_dat_url = get_asset_dat_url(res_version, asset_rel_filepath)
+    if md5 is None:
+        blob_filepath = asset_filepath
+    else:
+        blob_filepath = get_asset_store_filepath(md5, ".ab")
 
-    asset_dat_filepath = asset_filepath.with_suffix(".dat")
+    if not blob_filepath.is_file():
+        blob_filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    download_file(asset_dat_url, asset_dat_filepath)
+        run_asset_dat_func(
+            res_version,
+            asset_rel_filepath_str,
+            lambda asset_dat_filepath: extract_asset_dat(
+                asset_dat_filepath, asset_rel_filepath.as_posix(), blob_filepath
+            ),
+        )
 
-    with ZipFile(asset_dat_filepath) as zf:
-        asset_filepath.write_bytes(zf.read(asset_rel_filepath.as_posix()))
+        if get_asset_dat_policy() == AssetDatPolicy.REMOVE:
+            remove_asset_dat(res_version, asset_rel_filepath_str)
+
+    if blob_filepath != asset_filepath:
+        link_asset(blob_filepath, asset_filepath)
 
     return asset_filepath
 
 
+DEFAULT_PACK_THRESHOLD = 0.5
+
+
+def get_pack_threshold() -> float:
+    return config.get("pack_threshold", DEFAULT_PACK_THRESHOLD)
+
+
+def plan_pack_download(res_version: str, ab_name_lst: list[str]) -> dict[str, str]:
+    if get_pack_threshold() <= 0:
+        return {}
+
+    ab_info_dict = get_ab_info_dict(res_version)
+    pack_member_dict = get_pack_member_dict(res_version)
+
+    needed_member_dict: dict[str, list[str]] = {}
+
+    for ab_name in ab_name_lst:
+        pack_name = ab_info_dict.get(ab_name, {}).get("pid")
+        if pack_name not in pack_member_dict:
+            continue
+
+        needed_member_dict.setdefault(pack_name, []).append(ab_name)
+
+    pack_plan = {}
+
+    for pack_name, needed_member_lst in needed_member_dict.items():
+        if len(needed_member_lst) < 2:
+            continue
+
+        if (
+            len(needed_member_lst)
+            < len(pack_member_dict[pack_name]) * get_pack_threshold()
+        ):
+            continue
+
+        for ab_name in needed_member_lst:
+            pack_plan[ab_name] = pack_name
+
+    return pack_plan
+
+
+def download_pack(res_version: str, pack_name: str):
+    pack_info = get_pack_info_dict(res_version)[pack_name]
+
+    pack_dat_filepath = get_tmp_filepath().with_suffix(".dat")
+
+    try:
+        download_file(
+            get_asset_dat_url(res_version, Path(pack_name)), pack_dat_filepath
+        )
+
+        # members of a bad pack fall back to per-bundle downloads
+        try:
+            verify_file(
+                pack_dat_filepath,
+                pack_info.get("totalSize"),
+                pack_info.get("md5"),
+                None,
+            )
+        except ValueError as e:
+            print(f"info: {e}")
+            return
+
+        with ZipFile(pack_dat_filepath) as zf:
+            member_set = set(zf.namelist())
+
+        for ab_name in get_pack_member_dict(res_version)[pack_name]:
+            member = Path(ab_name).as_posix()
+
+            if member not in member_set:
+                continue
+
+            asset_filepath = get_asset_filepath(res_version, ab_name)
+
+            if asset_filepath.is_file():
+                continue
+
+            md5 = get_asset_md5(res_version, ab_name)
+
+            if md5 is None:
+                blob_filepath = asset_filepath
+            else:
+                blob_filepath = get_asset_store_filepath(md5, ".ab")
+
+            if not blob_filepath.is_file():
+                blob_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+                extract_asset_dat(pack_dat_filepath, member, blob_filepath)
+
+                try:
+                    verify_file(
+                        blob_filepath,
+                        get_ab_info_dict(res_version)[ab_name].get("abSize"),
+                        None,
+                        None,
+                    )
+                except ValueError as e:
+                    print(f"info: {e}")
+                    blob_filepath.unlink(missing_ok=True)
+                    continue
+
+            if blob_filepath != asset_filepath:
+                link_asset(blob_filepath, asset_filepath)
+
+    finally:
+        pack_dat_filepath.unlink(missing_ok=True)
+
+
+def is_asset_downloaded(res_version: str, asset_rel_filepath_str: str) -> bool:
+    asset_filepath = get_asset_filepath(res_version, asset_rel_filepath_str)
+
+    if asset_filepath.is_file():
+        return True
+
+    if get_asset_dat_policy() == AssetDatPolicy.ZIP:
+        return asset_filepath.with_suffix(".dat").is_file()
+
+    return False
+
+
+def prefetch_asset(res_version: str, asset_rel_filepath_str: str):
+    if get_asset_dat_policy() == AssetDatPolicy.ZIP:
+        download_asset_dat(res_version, asset_rel_filepath_str)
+    else:
+        download_asset(res_version, asset_rel_filepath_str)
+
+
+def open_asset_dat_member(asset_dat_filepath: Path, member: str) -> BinaryIO:
+    # the member keeps the archive file open after the ZipFile is closed
+    with ZipFile(asset_dat_filepath) as zf:
+        return zf.open(member)
+
+
+def open_asset_stream(res_version: str, asset_rel_filepath_str: str) -> BinaryIO:
+    return run_asset_dat_func(
+        res_version,
+        asset_rel_filepath_str,
+        lambda asset_dat_filepath: open_asset_dat_member(
+            asset_dat_filepath, Path(asset_rel_filepath_str).as_posix()
+        ),
+    )
+
+
 HOT_UPDATE_LIST_JSON = "hot_update_list.json"
 
+HOT_UPDATE_LIST_VALIDATOR_JSON = "hot_update_list_validator.json"
+
+
+def is_hot_update_list_revalidated() -> bool:
+    return config.get("revalidate_hot_update_list", False)
+
+
+def load_hot_update_list_validator(res_version: str) -> dict[str, str]:
+    try:
+        with open(
+            Path(ASSET_DIRPATH, res_version, HOT_UPDATE_LIST_VALIDATOR_JSON),
+            encoding="utf-8",
+        ) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_hot_update_list_validator(res_version: str, validator_dict: dict[str, str]):
+    with open(
+        Path(ASSET_DIRPATH, res_version, HOT_UPDATE_LIST_VALIDATOR_JSON),
+        "w",
+        encoding="utf-8",
+    ) as f:
+        json.dump(validator_dict, f)
+
+
+def refresh_hot_update_list(res_version: str) -> bool:
+    hot_update_list_filepath = Path(ASSET_DIRPATH, res_version, HOT_UPDATE_LIST_JSON)
+
+    hot_update_list_url = (
+        f"{ORIG_ASSET_URL_PREFIX}/{res_version}/{HOT_UPDATE_LIST_JSON}"
+    )
+
+    is_cached = hot_update_list_filepath.is_file()
+
+    header_dict = {}
+    if is_cached:
+        header_dict = get_conditional_header_dict(
+            load_hot_update_list_validator(res_version)
+        )
+
+    hot_update_list_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with download_semaphore:
+            validator_dict = http_download_file(
+                hot_update_list_url, hot_update_list_filepath, header_dict=header_dict
+            )
+
+    except OSError as e:
+        if not is_cached:
+            raise
+
+        # offline builds keep working from the cached copy
+        print(f"info: failed to revalidate {hot_update_list_url}, using cache: {e}")
+        return False
+
+    if validator_dict is None:
+        print(f"info: {hot_update_list_url} not modified")
+        return False
+
+    print(f"info: {hot_update_list_url} refreshed")
+
+    save_hot_update_list_validator(res_version, validator_dict)
+
+    # anything derived from the previous list is stale now
+    get_ab_info_dict.cache_clear()
+    get_pack_info_dict.cache_clear()
+    get_pack_member_dict.cache_clear()
+    get_verify_record_filepath(res_version).unlink(missing_ok=True)
+
+    return True
+
+
+revalidated_res_version_set: set[str] = set()
+
 
 def download_hot_update_list(res_version: str) -> Path:
     hot_update_list_filepath = Path(ASSET_DIRPATH, res_version, HOT_UPDATE_LIST_JSON)
 
+    if (
+        is_hot_update_list_revalidated()
+        and res_version not in revalidated_res_version_set
+    ):
+        revalidated_res_version_set.add(res_version)
+        refresh_hot_update_list(res_version)
+
     if hot_update_list_filepath.is_file():
         return hot_update_list_filepath
 
@@ -154,12 +606,23 @@ def get_json_tmp_filepath(tmp_filepath):
     return tmp_filepath.with_suffix(".json")
 
 
-def remove_flatc_tmp(tmp_filepath: Path):
-    bin_tmp_filepath = get_bin_tmp_filepath(tmp_filepath)
-    json_tmp_filepath = get_json_tmp_filepath(tmp_filepath)
+def get_flatc_scratch() -> FlatcScratch:
+    return FlatcScratch(config.get("flatc_scratch", FlatcScratch.MEMORY))
+
+
+def is_shm_available() -> bool:
+    return os.path.isdir(SHM_DIRPATH) and os.access(SHM_DIRPATH, os.W_OK)
+
+
+def get_flatc_tmp_dirpath() -> Path:
+    if get_flatc_scratch() == FlatcScratch.MEMORY and is_shm_available():
+        return Path(SHM_DIRPATH, f"openbachelorm_{uuid4()}")
+
+    return get_tmp_filepath()
+
 
-    bin_tmp_filepath.unlink(missing_ok=True)
-    json_tmp_filepath.unlink(missing_ok=True)
+def remove_flatc_tmp(tmp_dirpath: Path):
+    shutil.rmtree(tmp_dirpath, ignore_errors=True)
 
 
 def get_fbs_filepath(client_version: str, fbs_name: str) -> Path:
@@ -170,74 +633,204 @@ def get_fbs_filepath(client_version: str, fbs_name: str) -> Path:
     )
 
 
-def decode_flatc(script_bytes: bytes, client_version: str, fbs_name: str) -> str:
-    fbs_filepath = get_fbs_filepath(client_version, fbs_name)
+def get_flatc_engine() -> FlatcEngine:
+    return FlatcEngine(config.get("flatc_engine", FlatcEngine.PYTHON))
 
-    tmp_filepath = get_tmp_filepath()
 
-    bin_tmp_filepath = get_bin_tmp_filepath(tmp_filepath)
-    json_tmp_filepath = get_json_tmp_filepath(tmp_filepath)
+@lru_cache
+def get_fbs_schema(client_version: str, fbs_name: str) -> FbsSchema:
+    return load_fbs_schema(get_fbs_filepath(client_version, fbs_name))
 
-    try:
-        bin_tmp_filepath.write_bytes(script_bytes)
 
-        proc = subprocess.run(
-            [
-                "flatc",
-                "--strict-json",
-                "--natural-utf8",
-                "--no-warnings",
-                "--json",
-                "--raw-binary",
-                "-o",
-                json_tmp_filepath.parent.as_posix(),
-                fbs_filepath.as_posix(),
-                "--",
-                bin_tmp_filepath.as_posix(),
-            ]
-        )
+# keeps the flatc command line well under the windows length limit
+FLATC_BATCH_SIZE = 256
 
-        if proc.returncode:
-            raise ValueError(f"decode_flatc failed to decode {fbs_name}")
 
-        return json_tmp_filepath.read_text("utf-8")
+def iter_flatc_batch(lst: list):
+    for i in range(0, len(lst), FLATC_BATCH_SIZE):
+        yield lst[i : i + FLATC_BATCH_SIZE]
 
-    finally:
-        remove_flatc_tmp(tmp_filepath)
 
+def run_flatc_decode_many(
+    script_bytes_lst: list[bytes], client_version: str, fbs_name: str
+) -> list[str]:
+    fbs_filepath = get_fbs_filepath(client_version, fbs_name)
 
-def encode_flatc(json_str: str, client_version: str, fbs_name: str) -> bytes:
+    json_str_lst = []
+
+    for batch in iter_flatc_batch(script_bytes_lst):
+        tmp_dirpath = get_flatc_tmp_dirpath()
+
+        tmp_filepath_lst = [Path(tmp_dirpath, str(i)) for i in range(len(batch))]
+
+        try:
+            tmp_dirpath.mkdir()
+
+            for tmp_filepath, script_bytes in zip(tmp_filepath_lst, batch):
+                get_bin_tmp_filepath(tmp_filepath).write_bytes(script_bytes)
+
+            proc = subprocess.run(
+                [
+                    "flatc",
+                    "--strict-json",
+                    "--natural-utf8",
+                    "--no-warnings",
+                    "--json",
+                    "--raw-binary",
+                    "-o",
+                    tmp_dirpath.as_posix(),
+                    fbs_filepath.as_posix(),
+                    "--",
+                    *[get_bin_tmp_filepath(i).as_posix() for i in tmp_filepath_lst],
+                ]
+            )
+
+            if proc.returncode:
+                raise ValueError(f"decode_flatc failed to decode {fbs_name}")
+
+            for tmp_filepath in tmp_filepath_lst:
+                json_str_lst.append(
+                    get_json_tmp_filepath(tmp_filepath).read_text("utf-8")
+                )
+
+        finally:
+            remove_flatc_tmp(tmp_dirpath)
+
+    return json_str_lst
+
+
+def run_flatc_encode_many(
+    json_str_lst: list[str], client_version: str, fbs_name: str
+) -> list[bytes]:
     fbs_filepath = get_fbs_filepath(client_version, fbs_name)
 
-    tmp_filepath = get_tmp_filepath()
+    script_bytes_lst = []
+
+    for batch in iter_flatc_batch(json_str_lst):
+        tmp_dirpath = get_flatc_tmp_dirpath()
+
+        tmp_filepath_lst = [Path(tmp_dirpath, str(i)) for i in range(len(batch))]
+
+        try:
+            tmp_dirpath.mkdir()
+
+            for tmp_filepath, json_str in zip(tmp_filepath_lst, batch):
+                get_json_tmp_filepath(tmp_filepath).write_text(json_str, "utf-8")
+
+            proc = subprocess.run(
+                [
+                    "flatc",
+                    "--strict-json",
+                    "--natural-utf8",
+                    "--no-warnings",
+                    "--binary",
+                    "-o",
+                    tmp_dirpath.as_posix(),
+                    fbs_filepath.as_posix(),
+                    *[get_json_tmp_filepath(i).as_posix() for i in tmp_filepath_lst],
+                ]
+            )
+
+            if proc.returncode:
+                raise ValueError(f"encode_flatc failed to encode {fbs_name}")
+
+            for tmp_filepath in tmp_filepath_lst:
+                script_bytes_lst.append(get_bin_tmp_filepath(tmp_filepath).read_bytes())
+
+        finally:
+            remove_flatc_tmp(tmp_dirpath)
 
-    bin_tmp_filepath = get_bin_tmp_filepath(tmp_filepath)
-    json_tmp_filepath = get_json_tmp_filepath(tmp_filepath)
+    return script_bytes_lst
+
+
+def run_flatc_decode(script_bytes: bytes, client_version: str, fbs_name: str) -> str:
+    return run_flatc_decode_many([script_bytes], client_version, fbs_name)[0]
+
+
+def run_flatc_encode(json_str: str, client_version: str, fbs_name: str) -> bytes:
+    return run_flatc_encode_many([json_str], client_version, fbs_name)[0]
+
+
+def decode_flatc_table_many(
+    script_bytes_lst: list[bytes], client_version: str, fbs_name: str
+) -> list:
+    if get_flatc_engine() == FlatcEngine.FLATC:
+        return [
+            json.loads(i)
+            for i in run_flatc_decode_many(script_bytes_lst, client_version, fbs_name)
+        ]
+
+    schema = get_fbs_schema(client_version, fbs_name)
 
     try:
-        json_tmp_filepath.write_text(json_str, "utf-8")
+        return [schema.decode(i) for i in script_bytes_lst]
+    except ValueError as e:
+        raise ValueError(f"decode_flatc failed to decode {fbs_name}") from e
 
-        proc = subprocess.run(
-            [
-                "flatc",
-                "--strict-json",
-                "--natural-utf8",
-                "--no-warnings",
-                "--binary",
-                "-o",
-                bin_tmp_filepath.parent.as_posix(),
-                fbs_filepath.as_posix(),
-                json_tmp_filepath.as_posix(),
-            ]
+
+def encode_flatc_table_many(
+    table_lst: list, client_version: str, fbs_name: str
+) -> list[bytes]:
+    if get_flatc_engine() == FlatcEngine.FLATC:
+        return run_flatc_encode_many(
+            [json.dumps(i, ensure_ascii=False) for i in table_lst],
+            client_version,
+            fbs_name,
         )
 
-        if proc.returncode:
-            raise ValueError(f"encode_flatc failed to encode {fbs_name}")
+    schema = get_fbs_schema(client_version, fbs_name)
 
-        return bin_tmp_filepath.read_bytes()
+    try:
+        return [schema.encode(i) for i in table_lst]
+    except ValueError as e:
+        raise ValueError(f"encode_flatc failed to encode {fbs_name}") from e
 
-    finally:
-        remove_flatc_tmp(tmp_filepath)
+
+def decode_flatc_many(
+    script_bytes_lst: list[bytes], client_version: str, fbs_name: str
+) -> list[str]:
+    if get_flatc_engine() == FlatcEngine.FLATC:
+        return run_flatc_decode_many(script_bytes_lst, client_version, fbs_name)
+
+    return [
+        json.dumps(i, ensure_ascii=False)
+        for i in decode_flatc_table_many(script_bytes_lst, client_version, fbs_name)
+    ]
+
+
+def encode_flatc_many(
+    json_str_lst: list[str], client_version: str, fbs_name: str
+) -> list[bytes]:
+    if get_flatc_engine() == FlatcEngine.FLATC:
+        return run_flatc_encode_many(json_str_lst, client_version, fbs_name)
+
+    return encode_flatc_table_many(
+        [json.loads(i) for i in json_str_lst], client_version, fbs_name
+    )
+
+
+def decode_flatc_table(script_bytes: bytes, client_version: str, fbs_name: str):
+    return decode_flatc_table_many([script_bytes], client_version, fbs_name)[0]
+
+
+def encode_flatc_table(table, client_version: str, fbs_name: str) -> bytes:
+    return encode_flatc_table_many([table], client_version, fbs_name)[0]
+
+
+def decode_flatc(script_bytes: bytes, client_version: str, fbs_name: str) -> str:
+    return cached_codec(
+        ("decode_flatc", get_flatc_engine(), client_version, fbs_name),
+        script_bytes,
+        lambda data: decode_flatc_many([data], client_version, fbs_name)[0],
+    )
+
+
+def encode_flatc(json_str: str, client_version: str, fbs_name: str) -> bytes:
+    return cached_codec(
+        ("encode_flatc", get_flatc_engine(), client_version, fbs_name),
+        json_str,
+        lambda data: encode_flatc_many([data], client_version, fbs_name)[0],
+    )
 
 
 AES_KEY = b"UITpAi82pHAWwnzq"
@@ -267,10 +860,21 @@ def encrypt_data(data: bytes) -> bytes:
     return header + cipher.encrypt(pad(data, AES.block_size))
 
 
+# returned through a decorator chain when the mod func left the table as is
+UNCHANGED = object()
+
+
+def convert_if_changed(data, convert_func):
+    if data is UNCHANGED:
+        return UNCHANGED
+
+    return convert_func(data)
+
+
 def script_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return bytes_to_script(func(script_to_bytes(data)))
+        return convert_if_changed(func(script_to_bytes(data)), bytes_to_script)
 
     return wrapper
 
@@ -278,7 +882,7 @@ def script_decorator(func):
 def header_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return add_header(func(remove_header(data)))
+        return convert_if_changed(func(remove_header(data)), add_header)
 
     return wrapper
 
@@ -287,7 +891,7 @@ def flatc_decorator(client_version: str, fbs_name: str):
     def _flatc_decorator(func):
         @wraps(func)
         def wrapper(data):
-            return encode_flatc(
+            return convert_if_changed(
                 func(
                     decode_flatc(
                         data,
@@ -295,8 +899,7 @@ def flatc_decorator(client_version: str, fbs_name: str):
                         fbs_name,
                     )
                 ),
-                client_version,
-                fbs_name,
+                lambda json_str: encode_flatc(json_str, client_version, fbs_name),
             )
 
         return wrapper
@@ -307,7 +910,21 @@ def flatc_decorator(client_version: str, fbs_name: str):
 def json_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return json.dumps(func(json.loads(data)), ensure_ascii=False)
+        table = json.loads(data)
+
+        json_str = json.dumps(table, ensure_ascii=False)
+
+        table = func(table)
+
+        if table is UNCHANGED:
+            return UNCHANGED
+
+        new_json_str = json.dumps(table, ensure_ascii=False)
+
+        if new_json_str == json_str:
+            return UNCHANGED
+
+        return new_json_str
 
     return wrapper
 
@@ -348,7 +965,7 @@ def dump_table_decorator(name: str):
 def crypt_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return encrypt_data(func(decrypt_data(data)))
+        return convert_if_changed(func(decrypt_data(data)), encrypt_data)
 
     return wrapper
 
@@ -356,7 +973,14 @@ def crypt_decorator(func):
 def encoding_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return func(data.decode("utf-8")).encode("utf-8")
+        data_str = data.decode("utf-8")
+
+        new_data_str = func(data_str)
+
+        if new_data_str is UNCHANGED or new_data_str == data_str:
+            return UNCHANGED
+
+        return new_data_str.encode("utf-8")
 
     return wrapper
 
@@ -394,10 +1018,24 @@ def raw_dump_decorator(name: str):
     return _raw_dump_decorator
 
 
+def decode_bson(data: bytes):
+    return cached_codec(("decode_bson",), data, bson.decode)
+
+
 def bson_decorator(func):
     @wraps(func)
     def wrapper(data):
-        return bson.encode(func(bson.decode(data)))
+        table = func(decode_bson(data))
+
+        if table is UNCHANGED:
+            return UNCHANGED
+
+        new_data = bson.encode(table)
+
+        if new_data == data:
+            return UNCHANGED
+
+        return new_data
 
     return wrapper
 
@@ -550,21 +1188,126 @@ def is_known_table_available(table_name: KnownTable, client_version: str):
     return True
 
 
-def write_mod(mod_filepath: str, ab_name: str, content: bytes):
-    with ZipFile(mod_filepath, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(ab_name, content)
+# fixed so that identical content always yields an identical .dat
+MOD_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+DEFAULT_MOD_COMPRESS_LEVEL = 6
+
+MOD_COMPRESS_PROBE_SIZE = 64 * 1024
+MOD_COMPRESS_PROBE_COUNT = 4
+MOD_COMPRESS_PROBE_RATIO = 0.9
+
+
+def get_mod_compression() -> ModCompression:
+    return ModCompression(config.get("mod_compression", ModCompression.AUTO))
+
+
+def get_mod_compress_level() -> int:
+    return config.get("mod_compress_level", DEFAULT_MOD_COMPRESS_LEVEL)
+
+
+def is_compressible(f: BinaryIO, size: int) -> bool:
+    # lz4 bundles and other packed data barely shrink, a few fast samples tell
+    if not size:
+        return False
+
+    step = max(size // MOD_COMPRESS_PROBE_COUNT, MOD_COMPRESS_PROBE_SIZE)
+
+    probe_size = 0
+    compressed_size = 0
+
+    for offset in range(0, size, step):
+        f.seek(offset)
+        probe = f.read(MOD_COMPRESS_PROBE_SIZE)
+
+        probe_size += len(probe)
+        compressed_size += len(zlib.compress(probe, 1))
+
+    f.seek(0)
+
+    return compressed_size < probe_size * MOD_COMPRESS_PROBE_RATIO
+
+
+def resolve_mod_compression(
+    f: BinaryIO, size: int, compression: ModCompression | None = None
+) -> ModCompression:
+    if compression is None:
+        compression = get_mod_compression()
+
+    if compression == ModCompression.AUTO:
+        if is_compressible(f, size):
+            return ModCompression.DEFLATE
+
+        return ModCompression.STORED
+
+    return compression
+
+
+def get_mod_zip_info(ab_name: str, size: int, compression: ModCompression) -> ZipInfo:
+    zip_info = ZipInfo(ab_name, date_time=MOD_ZIP_DATE_TIME)
+    zip_info.external_attr = 0o644 << 16
+
+    # known up front so that ZipFile.open picks zip64 for large bundles
+    zip_info.file_size = size
+
+    if compression == ModCompression.DEFLATE:
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        zip_info._compresslevel = get_mod_compress_level()
+    else:
+        zip_info.compress_type = zipfile.ZIP_STORED
+
+    return zip_info
+
+
+MOD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def write_mod_stream(
+    mod_filepath: str,
+    ab_name: str,
+    f: BinaryIO,
+    size: int,
+    compression: ModCompression | None = None,
+):
+    compression = resolve_mod_compression(f, size, compression)
+
+    with (
+        ZipFile(mod_filepath, "w") as zf,
+        zf.open(get_mod_zip_info(ab_name, size, compression), "w") as dst,
+    ):
+        shutil.copyfileobj(f, dst, MOD_COPY_CHUNK_SIZE)
+
+
+def write_mod(
+    mod_filepath: str,
+    ab_name: str,
+    content: bytes,
+    compression: ModCompression | None = None,
+):
+    with io.BytesIO(content) as f:
+        write_mod_stream(mod_filepath, ab_name, f, len(content), compression)
+
+
+def write_mod_file(
+    mod_filepath: str,
+    ab_name: str,
+    ab_filepath: Path,
+    compression: ModCompression | None = None,
+):
+    with open(ab_filepath, "rb") as f:
+        write_mod_stream(
+            mod_filepath, ab_name, f, os.fstat(f.fileno()).st_size, compression
+        )
 
 
 RESOURCE_MANIFEST = "resource_manifest"
 
 
 def get_manifest(manifest_bytes: bytes, client_version: str):
-    return json.loads(
-        decode_flatc(
-            remove_header(manifest_bytes),
-            client_version,
-            RESOURCE_MANIFEST,
-        )
+    return decode_flatc_table(
+        remove_header(manifest_bytes),
+        client_version,
+        RESOURCE_MANIFEST,
     )
 
 
@@ -580,8 +1323,8 @@ def get_mod_level_decorator_lst(level_id: str, client_version: str, res_version:
 
 def get_manifest_bytes(manifest, client_version: str) -> bytes:
     return add_header(
-        encode_flatc(
-            json.dumps(manifest, ensure_ascii=False),
+        encode_flatc_table(
+            manifest,
             client_version,
             RESOURCE_MANIFEST,
         )
@@ -1,5 +1,3 @@
-from functools import wraps
-
 import flatbuffers
 
 from .fbs_codegen.v2_6_41 import (
@@ -26,15 +24,13 @@ from .fbs_codegen.v2_4_61 import (
 
 
 from .helper import (
-    script_decorator,
-    header_decorator,
-    json_decorator,
-    dump_table_decorator,
-    encode_flatc,
-    decode_flatc,
-    nop_mod_table_func,
-    get_mod_level_decorator_lst,
-    apply_decorator_lst,
+    script_to_bytes,
+    bytes_to_script,
+    remove_header,
+    add_header,
+    dump_table,
+    decode_flatc_table_many,
+    encode_flatc_table_many,
 )
 
 
@@ -65,50 +61,6 @@ def get_prts___levels(client_version: str):
             raise ValueError(f"fbs codegen not found for {client_version}")
 
 
-def migrate_flatc_decorator(
-    src_client_version: str, dst_client_version: str, fbs_name: str
-):
-    def _migrate_flatc_decorator(func):
-        @wraps(func)
-        def wrapper(data):
-            return encode_flatc(
-                func(
-                    decode_flatc(
-                        data,
-                        src_client_version,
-                        fbs_name,
-                    )
-                ),
-                dst_client_version,
-                fbs_name,
-            )
-
-        return wrapper
-
-    return _migrate_flatc_decorator
-
-
-def get_migrate_level_decorator_lst(
-    level_id: str, src_client_version: str, dst_client_version: str, res_version: str
-):
-    return [
-        script_decorator,
-        header_decorator,
-        migrate_flatc_decorator(
-            src_client_version, dst_client_version, "prts___levels"
-        ),
-        json_decorator,
-        dump_table_decorator(f"{level_id}_{res_version}_migrate"),
-    ]
-
-
-def get_codegen_migrate_level_decorator_lst():
-    return [
-        script_decorator,
-        header_decorator,
-    ]
-
-
 def recursive_handle_clz_Torappu_EnemyDatabase_AttributesDataT(
     obj,
     clz_Torappu_EnemyDatabase_AttributesDataT,
@@ -197,45 +149,68 @@ def get_codegen_migrate_func(
     return _codegen_migrate_func
 
 
-def migrate_level(
-    level_id: str,
+def dump_level_table_lst(
+    level_id_lst: list[str], level_table_lst: list, dump_name_suffix: str
+):
+    for level_id, level_table in zip(level_id_lst, level_table_lst):
+        dump_table(level_table, f"{level_id}{dump_name_suffix}_pre.json")
+        dump_table(level_table, f"{level_id}{dump_name_suffix}_post.json")
+
+
+def migrate_level_many(
+    level_id_lst: list[str],
     src_client_version: str,
     dst_client_version: str,
     res_version: str,
-    level_str: str,
-) -> str:
-    migrate_level_decorator_lst = get_migrate_level_decorator_lst(
-        level_id, src_client_version, dst_client_version, res_version
-    )
+    level_str_lst: list[str],
+) -> list[str]:
+    if len(level_id_lst) != len(level_str_lst):
+        raise ValueError("level_id_lst and level_str_lst differ in length")
 
-    migrate_func = nop_mod_table_func
+    level_bytes_lst = [remove_header(script_to_bytes(i)) for i in level_str_lst]
 
-    migrate_func = apply_decorator_lst(migrate_func, migrate_level_decorator_lst)
+    level_table_lst = decode_flatc_table_many(
+        level_bytes_lst, src_client_version, "prts___levels"
+    )
 
-    level_str = migrate_func(level_str)
+    dump_level_table_lst(level_id_lst, level_table_lst, f"_{res_version}_migrate")
 
-    # ----------
+    level_bytes_lst = encode_flatc_table_many(
+        level_table_lst, dst_client_version, "prts___levels"
+    )
 
-    codegen_migrate_level_decorator_lst = get_codegen_migrate_level_decorator_lst()
+    # ----------
 
     codegen_migrate_func = get_codegen_migrate_func(dst_client_version)
 
-    codegen_migrate_func = apply_decorator_lst(
-        codegen_migrate_func, codegen_migrate_level_decorator_lst
-    )
-
-    level_str = codegen_migrate_func(level_str)
+    level_bytes_lst = [codegen_migrate_func(i) for i in level_bytes_lst]
 
     # ----------
 
-    log_decorator_lst = get_mod_level_decorator_lst(
-        level_id, dst_client_version, res_version
+    level_table_lst = decode_flatc_table_many(
+        level_bytes_lst, dst_client_version, "prts___levels"
     )
 
-    log_func = nop_mod_table_func
+    dump_level_table_lst(level_id_lst, level_table_lst, f"_{res_version}")
 
-    log_func = apply_decorator_lst(log_func, log_decorator_lst)
+    level_bytes_lst = encode_flatc_table_many(
+        level_table_lst, dst_client_version, "prts___levels"
+    )
 
-    level_str = log_func(level_str)
+    return [bytes_to_script(add_header(i)) for i in level_bytes_lst]
 
-    return level_str
+
+def migrate_level(
+    level_id: str,
+    src_client_version: str,
+    dst_client_version: str,
+    res_version: str,
+    level_str: str,
+) -> str:
+    return migrate_level_many(
+        [level_id],
+        src_client_version,
+        dst_client_version,
+        res_version,
+        [level_str],
+    )[0]
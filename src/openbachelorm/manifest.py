@@ -14,7 +14,13 @@ import UnityPy
 from .resource import Resource
 from .const import TMP_DIRPATH
 from .helper import download_asset
-from .level_helper import migrate_level
+from .cache_gc import pin_path
+from .level_helper import migrate_level_many
+from .manifest_view import (
+    get_appendable_manifest,
+    get_manifest_bundle_name_lst,
+    get_manifest_column_lst,
+)
 
 
 @dataclass
@@ -165,14 +171,35 @@ class ManifestManager:
         self.bundle_lst: list[ManifestBundle] = []
         self.bundle_dict: dict[str, ManifestBundle] = {}
 
-        for bundle_dict in self.manifest["bundles"]:
+        # entries are never materialized as dicts, only these columns are read
+        for (
+            name,
+            props,
+            scc_index,
+            all_dependencies,
+            is_cacheable,
+            direct_dependencies,
+        ) in zip(
+            *get_manifest_column_lst(
+                self.manifest,
+                "bundles",
+                [
+                    ("name", None),
+                    ("props", 0),
+                    ("sccIndex", 0),
+                    ("allDependencies", None),
+                    ("isCacheable", False),
+                    ("directDependencies", None),
+                ],
+            )
+        ):
             bundle = ManifestBundle(
-                name=bundle_dict.get("name"),
-                props=bundle_dict.get("props", 0),
-                sccIndex=bundle_dict.get("sccIndex", 0),
-                allDependencies=deepcopy(bundle_dict.get("allDependencies")),
-                isCacheable=bundle_dict.get("isCacheable", False),
-                directDependencies=deepcopy(bundle_dict.get("directDependencies")),
+                name=name,
+                props=props,
+                sccIndex=scc_index,
+                allDependencies=deepcopy(all_dependencies),
+                isCacheable=is_cacheable,
+                directDependencies=deepcopy(direct_dependencies),
                 manifest=self,
             )
 
@@ -190,13 +217,23 @@ class ManifestManager:
         self.asset_tree_root = new_dir_node(ASSET_TREE_ROOT_NAME)
         self.dangling_asset_lst: list[ManifestAsset] = []
 
-        for asset_dict in self.manifest["assetToBundleList"]:
-            bundle_idx = asset_dict.get("bundleIndex", 0)
+        for asset_name, bundle_idx, name, path in zip(
+            *get_manifest_column_lst(
+                self.manifest,
+                "assetToBundleList",
+                [
+                    ("assetName", None),
+                    ("bundleIndex", 0),
+                    ("name", None),
+                    ("path", None),
+                ],
+            )
+        ):
             asset = ManifestAsset(
-                assetName=asset_dict.get("assetName"),
+                assetName=asset_name,
                 bundleIndex=bundle_idx,
-                name=asset_dict.get("name"),
-                path=asset_dict.get("path"),
+                name=name,
+                path=path,
                 manifest=self,
                 bundle=self.bundle_lst[bundle_idx],
             )
@@ -291,19 +328,18 @@ def migrate_activity_bundle(
 ):
     env = UnityPy.load(merger_bundle_filepath.as_posix())
 
-    for obj in env.objects:
-        if obj.type.name != "TextAsset":
-            continue
+    data_lst = [obj.read() for obj in env.objects if obj.type.name == "TextAsset"]
 
-        data = obj.read()
+    level_str_lst = migrate_level_many(
+        [data.m_Name for data in data_lst],
+        src_client_version,
+        dst_client_version,
+        res_version,
+        [data.m_Script for data in data_lst],
+    )
 
-        data.m_Script = migrate_level(
-            data.m_Name,
-            src_client_version,
-            dst_client_version,
-            res_version,
-            data.m_Script,
-        )
+    for data, level_str in zip(data_lst, level_str_lst):
+        data.m_Script = level_str
 
         data.save()
 
@@ -326,6 +362,8 @@ class ManifestMerger:
     ):
         self.mod_name = mod_name
 
+        pin_path(Path(TMP_DIRPATH, mod_name))
+
         self.target_res = target_res
         self.src_res_lst = src_res_lst
 
@@ -433,7 +471,23 @@ class ManifestMerger:
     def get_merger_bundle_filepath(self, bundle_name: str):
         return Path(TMP_DIRPATH, self.mod_name, bundle_name)
 
+    def prefetch_merger_bundle(self):
+        res_ab_name_dict: dict[int, tuple[Resource, list[str]]] = {}
+
+        for merger_bundle in self.merger_bundle_dict.values():
+            res = merger_bundle.bundle.manifest.resource
+
+            if id(res) not in res_ab_name_dict:
+                res_ab_name_dict[id(res)] = (res, [])
+
+            res_ab_name_dict[id(res)][1].append(merger_bundle.bundle.name)
+
+        for res, ab_name_lst in res_ab_name_dict.values():
+            res.prefetch(ab_name_lst)
+
     def prep_merger_bundle(self):
+        self.prefetch_merger_bundle()
+
         for bundle_name, merger_bundle in self.merger_bundle_dict.items():
             bundle_filepath = download_bundle(merger_bundle.bundle)
 
@@ -484,8 +538,10 @@ class ManifestMerger:
     def build_mod_bundle_init_bundle_idx_dict(self):
         self.bundle_idx_dict: dict[str, int] = {}
 
-        for i, bundle_obj in enumerate(self.new_manifest["bundles"]):
-            self.bundle_idx_dict[bundle_obj["name"]] = i
+        for i, bundle_name in enumerate(
+            get_manifest_bundle_name_lst(self.new_manifest)
+        ):
+            self.bundle_idx_dict[bundle_name] = i
 
     def build_mod_bundle(self):
         next_scc_idx = self.build_mod_bundle_get_next_scc_idx()
@@ -552,17 +608,18 @@ class ManifestMerger:
                 },
             )
 
-    def build_mod(self):
+    def build_mod(self, jobs: int = 0):
         dump_tree(
             self.merger_tree_root,
             f"merger_tree_{self.target_res.res_version}.txt",
         )
 
-        self.new_manifest = deepcopy(self.target_res.manifest)
+        # only appended to, untouched entries stay in the original buffer
+        self.new_manifest = get_appendable_manifest(self.target_res.manifest)
 
         self.build_mod_bundle()
         self.build_mod_asset()
 
         self.target_res.mark_manifest(self.new_manifest)
 
-        self.target_res.build_mod(self.mod_name)
+        return self.target_res.build_mod(self.mod_name, jobs)
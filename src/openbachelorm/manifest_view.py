@@ -0,0 +1,416 @@
+import json
+import hashlib
+from copy import deepcopy
+from collections.abc import Mapping, Sequence
+
+import flatbuffers
+
+from .fbs_codegen.v2_6_41 import (
+    resource_manifest_generated as resource_manifest_v2_6_41,
+)
+from .fbs_codegen.v2_6_21 import (
+    resource_manifest_generated as resource_manifest_v2_6_21,
+)
+from .fbs_codegen.v2_6_01 import (
+    resource_manifest_generated as resource_manifest_v2_6_01,
+)
+from .fbs_codegen.v2_5_80 import (
+    resource_manifest_generated as resource_manifest_v2_5_80,
+)
+from .fbs_codegen.v2_5_60 import (
+    resource_manifest_generated as resource_manifest_v2_5_60,
+)
+from .fbs_codegen.v2_5_04 import (
+    resource_manifest_generated as resource_manifest_v2_5_04,
+)
+from .fbs_codegen.v2_4_61 import (
+    resource_manifest_generated as resource_manifest_v2_4_61,
+)
+from .fbs_codec import FbsDecoder, FbsTable
+from .helper import get_fbs_schema, add_header, get_manifest_bytes, RESOURCE_MANIFEST
+
+
+def get_resource_manifest(client_version: str):
+    match client_version:
+        case "2.6.41":
+            return resource_manifest_v2_6_41
+
+        case "2.6.21":
+            return resource_manifest_v2_6_21
+
+        case "2.6.01":
+            return resource_manifest_v2_6_01
+
+        case "2.5.80":
+            return resource_manifest_v2_5_80
+
+        case "2.5.60":
+            return resource_manifest_v2_5_60
+
+        case "2.5.04":
+            return resource_manifest_v2_5_04
+
+        case "2.4.61":
+            return resource_manifest_v2_4_61
+
+        case _:
+            raise ValueError(f"fbs codegen not found for {client_version}")
+
+
+def is_manifest_view_available(client_version: str) -> bool:
+    try:
+        get_resource_manifest(client_version)
+    except ValueError:
+        return False
+
+    return True
+
+
+class ManifestVectorView(Sequence):
+    def __init__(
+        self, decoder: FbsDecoder, table: FbsTable, vector_pos: int, length: int
+    ):
+        self.decoder = decoder
+        self.table = table
+        self.vector_pos = vector_pos
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def get_item_pos(self, idx: int) -> int:
+        if idx < 0:
+            idx += self.length
+
+        if not 0 <= idx < self.length:
+            raise IndexError(idx)
+
+        return self.decoder.read_table_vector_item_pos(self.vector_pos, idx)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.length))]
+
+        # a fresh dict per access, edits do not reach the buffer
+        return self.decoder.read_table(self.table, self.get_item_pos(idx))
+
+    def get_column_lst(self, field_default_lst: list[tuple[str, object]]) -> list[list]:
+        fbs_field_lst = []
+        default_lst = []
+
+        for field_name, default in field_default_lst:
+            fbs_field = self.table.field_dict.get(field_name)
+
+            # older schemas lack some fields
+            if fbs_field is None or fbs_field.is_deprecated:
+                fbs_field = None
+            else:
+                default_lst.append(default)
+
+            fbs_field_lst.append(fbs_field)
+
+        # one vtable walk per entry, only the requested fields are read
+        column_iter = iter(
+            self.decoder.read_table_vector_column_lst(
+                self.vector_pos,
+                self.length,
+                [i for i in fbs_field_lst if i is not None],
+                default_lst,
+            )
+        )
+
+        return [
+            [default] * self.length if fbs_field is None else next(column_iter)
+            for fbs_field, (_, default) in zip(fbs_field_lst, field_default_lst)
+        ]
+
+
+class ManifestView(Mapping):
+    def __init__(self, manifest_bytes: bytes, client_version: str):
+        resource_manifest = get_resource_manifest(client_version)
+
+        self.manifest_bytes = manifest_bytes
+        self.client_version = client_version
+
+        self.root = resource_manifest.clz_Torappu_Resource_ResourceManifest.GetRootAs(
+            manifest_bytes
+        )
+
+        schema = get_fbs_schema(client_version, RESOURCE_MANIFEST)
+
+        self.decoder = FbsDecoder(manifest_bytes)
+
+        self.field_dict = {}
+
+        if self.root.RawCount():
+            self.field_dict["rawCount"] = self.root.RawCount()
+
+        for field_name, is_none in (
+            ("bundles", self.root.BundlesIsNone()),
+            ("assetToBundleList", self.root.AssetToBundleListIsNone()),
+        ):
+            if is_none:
+                continue
+
+            fbs_field = schema.root_table.field_dict[field_name]
+
+            vector_pos, length = self.decoder.read_vector_header(
+                self.decoder.get_field_pos(fbs_field, self.root._tab.Pos)
+            )
+
+            self.field_dict[field_name] = ManifestVectorView(
+                self.decoder, fbs_field.table, vector_pos, length
+            )
+
+    def __getitem__(self, key: str):
+        return self.field_dict[key]
+
+    def __iter__(self):
+        return iter(self.field_dict)
+
+    def __len__(self):
+        return len(self.field_dict)
+
+    def to_dict(self) -> dict:
+        return {
+            key: list(value) if isinstance(value, ManifestVectorView) else value
+            for key, value in self.field_dict.items()
+        }
+
+    def __deepcopy__(self, memo):
+        return self.to_dict()
+
+
+class ManifestAppendVectorView(Sequence):
+    def __init__(self, base_vector: ManifestVectorView | None):
+        self.base_vector = base_vector
+        self.base_length = len(base_vector) if base_vector is not None else 0
+
+        self.appended_lst: list[dict] = []
+
+    def __len__(self):
+        return self.base_length + len(self.appended_lst)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+
+        if idx < self.base_length:
+            return self.base_vector[idx]
+
+        # appended entries are the only ones that can still be edited
+        return self.appended_lst[idx - self.base_length]
+
+    def append(self, obj: dict):
+        self.appended_lst.append(obj)
+
+    def get_column_lst(self, field_default_lst: list[tuple[str, object]]) -> list[list]:
+        if self.base_vector is not None:
+            column_lst = self.base_vector.get_column_lst(field_default_lst)
+        else:
+            column_lst = [[] for _ in field_default_lst]
+
+        for column, (field_name, default) in zip(column_lst, field_default_lst):
+            column.extend(i.get(field_name, default) for i in self.appended_lst)
+
+        return column_lst
+
+
+class ManifestAppendView(Mapping):
+    def __init__(self, base: ManifestView):
+        self.base = base
+
+        self.field_dict = {}
+
+        if "rawCount" in base:
+            self.field_dict["rawCount"] = base["rawCount"]
+
+        for field_name in ("bundles", "assetToBundleList"):
+            self.field_dict[field_name] = ManifestAppendVectorView(base.get(field_name))
+
+    def __getitem__(self, key: str):
+        return self.field_dict[key]
+
+    def __iter__(self):
+        return iter(self.field_dict)
+
+    def __len__(self):
+        return len(self.field_dict)
+
+    def to_dict(self) -> dict:
+        return {
+            key: list(value) if isinstance(value, ManifestAppendVectorView) else value
+            for key, value in self.field_dict.items()
+        }
+
+    def __deepcopy__(self, memo):
+        return self.to_dict()
+
+    def get_digest(self) -> str:
+        h = hashlib.sha256(self.base.manifest_bytes)
+
+        h.update(
+            json.dumps(
+                [
+                    self.field_dict.get("rawCount"),
+                    self.field_dict["bundles"].appended_lst,
+                    self.field_dict["assetToBundleList"].appended_lst,
+                ],
+                ensure_ascii=False,
+            ).encode("utf-8")
+        )
+
+        return h.hexdigest()
+
+    def build(self) -> bytes:
+        resource_manifest = get_resource_manifest(self.base.client_version)
+
+        manifest_bytes = self.base.manifest_bytes
+
+        builder = flatbuffers.Builder(len(manifest_bytes) + 1024)
+
+        # the original buffer is copied as is to the end of the new one, its
+        # entries keep their relative offsets and are referenced in place
+        builder.Prep(1, len(manifest_bytes))
+        builder.head -= len(manifest_bytes)
+        builder.Bytes[builder.head : builder.head + len(manifest_bytes)] = (
+            manifest_bytes
+        )
+
+        base_end = builder.Offset()
+
+        bundle_vector = self.build_vector(
+            builder,
+            base_end,
+            self.field_dict["bundles"],
+            resource_manifest.clz_Torappu_Resource_ResourceManifest_BundleMetaT,
+            resource_manifest.clz_Torappu_Resource_ResourceManifestStartBundlesVector,
+        )
+
+        asset_to_bundle_vector = self.build_vector(
+            builder,
+            base_end,
+            self.field_dict["assetToBundleList"],
+            resource_manifest.clz_Torappu_Resource_ResourceManifest_AssetToBundleMetaT,
+            resource_manifest.clz_Torappu_Resource_ResourceManifestStartAssetToBundleListVector,
+        )
+
+        resource_manifest.clz_Torappu_Resource_ResourceManifestStart(builder)
+
+        resource_manifest.clz_Torappu_Resource_ResourceManifestAddRawCount(
+            builder, self.field_dict.get("rawCount", 0)
+        )
+
+        if bundle_vector is not None:
+            resource_manifest.clz_Torappu_Resource_ResourceManifestAddBundles(
+                builder, bundle_vector
+            )
+
+        if asset_to_bundle_vector is not None:
+            resource_manifest.clz_Torappu_Resource_ResourceManifestAddAssetToBundleList(
+                builder, asset_to_bundle_vector
+            )
+
+        builder.Finish(
+            resource_manifest.clz_Torappu_Resource_ResourceManifestEnd(builder)
+        )
+
+        return bytes(builder.Output())
+
+    def build_vector(
+        self,
+        builder: flatbuffers.Builder,
+        base_end: int,
+        vector: ManifestAppendVectorView,
+        item_t_cls,
+        start_vector_func,
+    ) -> int | None:
+        if vector.base_vector is None and not vector.appended_lst:
+            return None
+
+        appended_off_lst = []
+
+        for obj in vector.appended_lst:
+            try:
+                item_t = item_t_cls(**obj)
+            except TypeError as e:
+                raise ValueError(f"invalid manifest entry {obj}: {e}") from e
+
+            appended_off_lst.append(item_t.Pack(builder))
+
+        start_vector_func(builder, len(vector))
+
+        for off in reversed(appended_off_lst):
+            builder.PrependUOffsetTRelative(off)
+
+        for idx in reversed(range(vector.base_length)):
+            builder.PrependUOffsetTRelative(
+                base_end - vector.base_vector.get_item_pos(idx)
+            )
+
+        return builder.EndVector()
+
+
+def get_appendable_manifest(manifest):
+    if isinstance(manifest, ManifestView):
+        return ManifestAppendView(manifest)
+
+    return deepcopy(manifest)
+
+
+def get_manifest_digest(manifest) -> str:
+    if isinstance(manifest, ManifestAppendView):
+        return manifest.get_digest()
+
+    return hashlib.sha256(
+        json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def encode_manifest(manifest, client_version: str) -> bytes:
+    if isinstance(manifest, ManifestAppendView):
+        return add_header(manifest.build())
+
+    return get_manifest_bytes(manifest, client_version)
+
+
+def get_manifest_column_lst(
+    manifest, vector_name: str, field_default_lst: list[tuple[str, object]]
+) -> list[list]:
+    if vector_name not in manifest:
+        return [[] for _ in field_default_lst]
+
+    if isinstance(manifest, (ManifestView, ManifestAppendView)):
+        return manifest[vector_name].get_column_lst(field_default_lst)
+
+    return [
+        [i.get(field_name, default) for i in manifest[vector_name]]
+        for field_name, default in field_default_lst
+    ]
+
+
+def get_manifest_field_lst(
+    manifest, vector_name: str, field_name: str, default=None
+) -> list:
+    return get_manifest_column_lst(manifest, vector_name, [(field_name, default)])[0]
+
+
+def get_manifest_bundle_name_lst(manifest) -> list[str | None]:
+    return get_manifest_field_lst(manifest, "bundles", "name")
+
+
+def get_manifest_dict(manifest) -> dict:
+    if isinstance(manifest, (ManifestView, ManifestAppendView)):
+        return manifest.to_dict()
+
+    return manifest
+
+
+def get_manifest_asset_name_lst(manifest) -> list[str | None]:
+    return get_manifest_field_lst(manifest, "assetToBundleList", "assetName")
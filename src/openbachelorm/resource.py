@@ -1,56 +1,159 @@
+import os
 import json
+from bisect import bisect_left
+from functools import partial
 from pathlib import Path
+from weakref import WeakKeyDictionary, ref
+from collections import OrderedDict
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import zipfile
 from zipfile import ZipFile
 
 import UnityPy
+from UnityPy.streams import EndianBinaryReader
 from packaging.version import Version
 
 from .helper import (
     download_hot_update_list,
     download_asset,
+    get_asset_filepath,
+    get_download_connections,
+    get_asset_dat_policy,
+    is_asset_downloaded,
+    prefetch_asset,
+    get_ab_info_dict,
+    get_ab_content_key,
+    plan_pack_download,
+    download_pack,
+    open_asset_stream,
     escape_ab_name,
     write_mod,
+    write_mod_file,
     get_manifest,
+    remove_header,
     dump_table,
-    get_manifest_bytes,
     apply_decorator_lst,
+    UNCHANGED,
 )
-from .const import TMP_DIRPATH, ASSET_DIRPATH, MOD_DIRPATH
+from .manifest_view import (
+    ManifestView,
+    is_manifest_view_available,
+    get_manifest_dict,
+    get_manifest_asset_name_lst,
+    get_manifest_digest,
+    encode_manifest,
+)
+from .cache_gc import pin_path
+from .downloader import get_part_filepath
+from .verify import (
+    load_verify_record,
+    save_verify_record,
+    verify_asset,
+    get_file_md5,
+)
+from .build_cache import (
+    BuildReport,
+    is_build_cache_enabled,
+    get_func_fingerprint,
+    get_fingerprint,
+    load_build_cache,
+    save_build_cache,
+    is_build_cache_hit,
+    run_cached_build_task,
+)
+from .config import config
+from .const import TMP_DIRPATH, ASSET_DIRPATH, MOD_DIRPATH, AssetDatPolicy
 
 
-def get_anon_asset_name_set(asset_env: UnityPy.Environment):
-    anon_asset_name_set: set[str] = set()
+def get_obj_name(obj) -> str:
+    peek_name = getattr(obj, "peek_name", None)
 
-    for obj in asset_env.objects:
-        if obj.type.name == "TextAsset":
-            data = obj.read()
+    if peek_name is not None:
+        name = peek_name()
+        if name is not None:
+            return name
+
+    return obj.read().m_Name
 
-            anon_asset_name_set.add(data.m_Name)
 
-    return anon_asset_name_set
+text_asset_index_dict: WeakKeyDictionary[UnityPy.Environment, dict] = (
+    WeakKeyDictionary()
+)
 
 
-def get_table_data_by_prefix(asset_env: UnityPy.Environment, table_prefix: str):
+def get_text_asset_index(asset_env: UnityPy.Environment) -> dict[str, list]:
+    if asset_env in text_asset_index_dict:
+        return text_asset_index_dict[asset_env]
+
+    text_asset_index: dict[str, list] = {}
+
     for obj in asset_env.objects:
         if obj.type.name == "TextAsset":
-            data = obj.read()
+            text_asset_index.setdefault(get_obj_name(obj), []).append(obj)
+
+    text_asset_index_dict[asset_env] = text_asset_index
+
+    return text_asset_index
+
 
-            if data.m_Name.startswith(table_prefix):
-                return data
+def get_anon_asset_name_set(asset_env: UnityPy.Environment):
+    return set(get_text_asset_index(asset_env))
+
+
+def get_table_data_by_prefix(asset_env: UnityPy.Environment, table_prefix: str):
+    for name, obj_lst in get_text_asset_index(asset_env).items():
+        if name.startswith(table_prefix):
+            return obj_lst[0].read()
 
     return None
 
 
 def get_level_data_by_level_id(asset_env: UnityPy.Environment, level_id: str):
-    for obj in asset_env.objects:
-        if obj.type.name == "TextAsset":
-            data = obj.read()
+    obj_lst = get_text_asset_index(asset_env).get(level_id)
 
-            if data.m_Name == level_id:
-                return data
+    if obj_lst is None:
+        return None
+
+    return obj_lst[0].read()
+
+
+ANON_INDEX_JSON = "anon_index.json"
+
+
+def get_anon_index_filepath(res_version: str) -> Path:
+    return Path(ASSET_DIRPATH, res_version, ANON_INDEX_JSON)
+
+
+def load_anon_index(res_version: str) -> dict[str, dict]:
+    try:
+        with open(get_anon_index_filepath(res_version), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
-    return None
+
+def save_anon_index(res_version: str, anon_index: dict[str, dict]):
+    anon_index_filepath = get_anon_index_filepath(res_version)
+
+    anon_index_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    part_filepath = get_part_filepath(anon_index_filepath)
+
+    try:
+        with open(part_filepath, "w", encoding="utf-8") as f:
+            json.dump(anon_index, f, ensure_ascii=False)
+
+        part_filepath.replace(anon_index_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def is_manifest_dumped() -> bool:
+    # a dump decodes every manifest entry, which the lazy view avoids
+    return config.get("dump_manifest", False)
 
 
 def get_mod_filepath(mod_dirpath: Path, ab_name: str):
@@ -149,13 +252,181 @@ def build_legacy_pseudo_manifest(torappu_index_tree, torappu_tree):
     return pseudo_manifest
 
 
+def get_build_jobs() -> int:
+    return config.get("build_jobs", os.cpu_count() or 1)
+
+
+def run_build_task_dict(task_dict: dict, jobs: int):
+    if jobs <= 0:
+        jobs = get_build_jobs()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        future_dict = {
+            ab_name: executor.submit(task)
+            for ab_name, task in sorted(task_dict.items())
+        }
+
+    exception_lst = []
+
+    for ab_name, future in future_dict.items():
+        exception = future.exception()
+
+        if exception is not None:
+            exception.add_note(f"failed to build {ab_name}")
+            exception_lst.append(exception)
+
+    if exception_lst:
+        raise ExceptionGroup(
+            f"build_mod failed for {len(exception_lst)} bundles", exception_lst
+        )
+
+
+def get_asset_env_budget() -> int | None:
+    return config.get("asset_env_budget")
+
+
+def get_loaded_file_size(loaded_file) -> int:
+    if isinstance(loaded_file, EndianBinaryReader):
+        return loaded_file.Length
+
+    size = 0
+
+    # a bundle keeps no reader of its own, only its decompressed members
+    reader = getattr(loaded_file, "reader", None)
+    if reader is not None:
+        size += reader.Length
+
+    for child_file in getattr(loaded_file, "files", {}).values():
+        size += get_loaded_file_size(child_file)
+
+    return size
+
+
+def get_asset_env_size(asset_env: UnityPy.Environment) -> int:
+    return sum(get_loaded_file_size(i) for i in asset_env.files.values())
+
+
+class AssetEnvLru:
+    # one budget shared by the asset_dict of every Resource in the process,
+    # counted in decompressed bundle bytes, parsed objects come on top
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entry_dict: OrderedDict[tuple[int, str], tuple[ref, int]] = OrderedDict()
+        self.size = 0
+
+    def touch(self, asset_env_dict: "AssetEnvDict", ab_name: str):
+        with self.lock:
+            key = (id(asset_env_dict), ab_name)
+            if key in self.entry_dict:
+                self.entry_dict.move_to_end(key)
+
+    def add(self, asset_env_dict: "AssetEnvDict", ab_name: str, size: int):
+        with self.lock:
+            key = (id(asset_env_dict), ab_name)
+
+            if key in self.entry_dict:
+                self.size -= self.entry_dict.pop(key)[1]
+
+            self.entry_dict[key] = (ref(asset_env_dict), size)
+            self.size += size
+
+    def discard(self, asset_env_dict: "AssetEnvDict", ab_name: str):
+        with self.lock:
+            entry = self.entry_dict.pop((id(asset_env_dict), ab_name), None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def evict(self, asset_env_dict: "AssetEnvDict", ab_name: str):
+        budget = get_asset_env_budget()
+        if budget is None:
+            return
+
+        # the entry just put stays even if pinned ones exceed the budget
+        kept_key = (id(asset_env_dict), ab_name)
+
+        evicted_lst = []
+
+        with self.lock:
+            for key, (owner_ref, size) in list(self.entry_dict.items()):
+                if self.size <= budget:
+                    break
+
+                if key == kept_key:
+                    continue
+
+                owner = owner_ref()
+                if owner is not None and key[1] in owner.pinned_ab_name_set:
+                    continue
+
+                del self.entry_dict[key]
+                self.size -= size
+
+                if owner is not None:
+                    evicted_lst.append((owner, key[1]))
+
+            entry_count = len(self.entry_dict)
+            size = self.size
+
+        for owner, ab_name in evicted_lst:
+            owner.env_dict.pop(ab_name, None)
+
+        if evicted_lst:
+            print(
+                f"info: evicted {len(evicted_lst)} environments, "
+                f"{entry_count} loaded using about {size} bytes"
+            )
+
+
+asset_env_lru = AssetEnvLru()
+
+
+class AssetEnvDict:
+    def __init__(self, pinned_ab_name_set: set[str]):
+        self.env_dict: dict[str, UnityPy.Environment] = {}
+        self.pinned_ab_name_set = pinned_ab_name_set
+
+    def __contains__(self, ab_name: str):
+        return ab_name in self.env_dict
+
+    def __getitem__(self, ab_name: str) -> UnityPy.Environment:
+        asset_env = self.env_dict[ab_name]
+
+        asset_env_lru.touch(self, ab_name)
+
+        return asset_env
+
+    def __len__(self):
+        return len(self.env_dict)
+
+    def put(self, ab_name: str, asset_env: UnityPy.Environment, size: int):
+        self.env_dict[ab_name] = asset_env
+
+        asset_env_lru.add(self, ab_name, size)
+        asset_env_lru.evict(self, ab_name)
+
+    def pop(self, ab_name: str):
+        asset_env_lru.discard(self, ab_name)
+
+        return self.env_dict.pop(ab_name)
+
+
+def get_asset_env_usage() -> tuple[int, int]:
+    with asset_env_lru.lock:
+        return len(asset_env_lru.entry_dict), asset_env_lru.size
+
+
 class Resource:
     def __init__(self, client_version: str, res_version: str):
         self.client_version = client_version
         self.res_version = res_version
 
-        self.asset_dict: dict[str, UnityPy.Environment] = {}
         self.modified_asset_set: set[str] = set()
+        # keys of the mod_table / mod_level calls each bundle went through
+        self.mod_key_dict: dict[str, list[list]] = {}
+        # bundles edited outside of mod_table / mod_level are never cached
+        self.uncacheable_asset_set: set[str] = set()
+        # unmodified environments may be evicted and are reloaded on access
+        self.asset_dict = AssetEnvDict(self.modified_asset_set)
 
         self.anon_ab_name_set: set[str] = None
         self.anon_asset_name_dict: dict[str, set[str]] = {}
@@ -165,8 +436,15 @@ class Resource:
 
         self.foreign_asset_dict: dict[str, Path] = {}
 
+        self.verify_future = None
+
+        pin_path(Path(ASSET_DIRPATH, res_version))
+
         self.load_hot_update_list()
 
+        if config.get("verify_asset", False):
+            self.start_verify_asset()
+
     def load_hot_update_list(self):
         hot_update_list_filepath = download_hot_update_list(self.res_version)
 
@@ -179,16 +457,31 @@ class Resource:
         if self.manifest_loaded:
             return
 
+        self.wait_verify_asset()
+
         self.manifest_ab_name = self.hot_update_list["manifestName"]
 
-        self.manifest = get_manifest(
-            download_asset(self.res_version, self.manifest_ab_name).read_bytes(),
-            self.client_version,
-        )
+        manifest_bytes = download_asset(
+            self.res_version, self.manifest_ab_name
+        ).read_bytes()
+
+        # entries are only materialized when touched
+        if is_manifest_view_available(self.client_version):
+            self.manifest = ManifestView(
+                remove_header(manifest_bytes), self.client_version
+            )
+        else:
+            self.manifest = get_manifest(manifest_bytes, self.client_version)
 
         self.manifest_loaded = True
 
-        dump_table(self.manifest, f"manifest_{self.res_version}_pre.json")
+        self.build_manifest_index()
+
+        if is_manifest_dumped():
+            dump_table(
+                get_manifest_dict(self.manifest),
+                f"manifest_{self.res_version}_pre.json",
+            )
 
     def load_legacy_pseudo_manifest(self):
         if self.manifest_loaded:
@@ -204,45 +497,233 @@ class Resource:
 
         self.manifest_loaded = True
 
+        self.build_manifest_index()
+
         dump_table(self.manifest, f"pseudo_manifest_{self.res_version}_pre.json")
 
     def get_ab_name_from_manifest(self, asset_obj):
         return self.manifest["bundles"][asset_obj["bundleIndex"]]["name"]
 
+    def build_manifest_index(self):
+        asset_name_lst = get_manifest_asset_name_lst(self.manifest)
+
+        # dangling assets have no name and cannot be queried
+        named_idx_lst = [i for i, asset_name in enumerate(asset_name_lst) if asset_name]
+
+        # first occurrence wins, as with the former linear scan
+        self.manifest_asset_idx_dict: dict[str, int] = {}
+
+        for i in named_idx_lst:
+            self.manifest_asset_idx_dict.setdefault(asset_name_lst[i], i)
+
+        sorted_idx_lst = sorted(named_idx_lst, key=lambda i: asset_name_lst[i])
+
+        self.manifest_sorted_asset_name_lst = [
+            asset_name_lst[i] for i in sorted_idx_lst
+        ]
+        self.manifest_sorted_idx_lst = sorted_idx_lst
+
+    def get_manifest_prefix_idx_lst(self, asset_name_prefix: str) -> list[int]:
+        sorted_asset_name_lst = self.manifest_sorted_asset_name_lst
+
+        start = bisect_left(sorted_asset_name_lst, asset_name_prefix)
+
+        end = start
+        while end < len(sorted_asset_name_lst) and sorted_asset_name_lst[
+            end
+        ].startswith(asset_name_prefix):
+            end += 1
+
+        return self.manifest_sorted_idx_lst[start:end]
+
     def query_manifest(self, asset_name: str):
         self.load_manifest()
 
-        for asset_obj in self.manifest["assetToBundleList"]:
-            if asset_obj["assetName"] == asset_name:
-                return self.get_ab_name_from_manifest(asset_obj)
+        if asset_name not in self.manifest_asset_idx_dict:
+            raise KeyError(f"{asset_name} not found")
 
-        raise KeyError(f"{asset_name} not found")
+        return self.get_ab_name_from_manifest(
+            self.manifest["assetToBundleList"][self.manifest_asset_idx_dict[asset_name]]
+        )
 
     def query_manifest_by_prefix(self, asset_name_prefix: str):
         self.load_manifest()
 
-        for asset_obj in self.manifest["assetToBundleList"]:
-            if asset_obj["assetName"].startswith(asset_name_prefix):
-                return self.get_ab_name_from_manifest(asset_obj)
+        idx_lst = self.get_manifest_prefix_idx_lst(asset_name_prefix)
+
+        if not idx_lst:
+            raise KeyError(f"{asset_name_prefix} not found")
+
+        return self.get_ab_name_from_manifest(
+            self.manifest["assetToBundleList"][min(idx_lst)]
+        )
+
+    def query_manifest_all_by_prefix(
+        self, asset_name_prefix: str
+    ) -> list[tuple[str, str]]:
+        self.load_manifest()
+
+        asset_obj_lst = self.manifest["assetToBundleList"]
+
+        return [
+            (
+                asset_obj_lst[i]["assetName"],
+                self.get_ab_name_from_manifest(asset_obj_lst[i]),
+            )
+            for i in sorted(self.get_manifest_prefix_idx_lst(asset_name_prefix))
+        ]
+
+    def verify_asset(self, jobs: int = 0) -> list[str]:
+        if jobs <= 0:
+            jobs = get_download_connections()
+
+        verify_record = load_verify_record(self.res_version)
+
+        ab_info_lst = self.hot_update_list["abInfos"]
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            result_lst = list(
+                executor.map(
+                    lambda ab_info: verify_asset(
+                        self.res_version, ab_info, verify_record
+                    ),
+                    ab_info_lst,
+                )
+            )
+
+        mismatch_ab_name_lst = []
+
+        for ab_info, (is_ok, stamp_dict) in zip(ab_info_lst, result_lst):
+            if not is_ok:
+                mismatch_ab_name_lst.append(ab_info["name"])
+
+            for key, stamp in stamp_dict.items():
+                if stamp is None:
+                    verify_record.pop(key, None)
+                else:
+                    verify_record[key] = stamp
+
+        save_verify_record(self.res_version, verify_record)
+
+        return mismatch_ab_name_lst
+
+    def start_verify_asset(self, jobs: int = 0):
+        if self.verify_future is not None:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.verify_future = executor.submit(self.verify_asset, jobs)
+        executor.shutdown(wait=False)
+
+    def wait_verify_asset(self):
+        if self.verify_future is None:
+            return
+
+        verify_future = self.verify_future
+        self.verify_future = None
+
+        mismatch_ab_name_lst = verify_future.result()
+
+        self.prefetch(mismatch_ab_name_lst)
+
+    def iter_prefetch(self, ab_name_lst: list[str], jobs: int = 0, depth: int = 0):
+        self.wait_verify_asset()
+
+        if jobs <= 0:
+            jobs = get_download_connections()
+
+        # bounds how far downloads may run ahead of the consumer
+        if depth <= 0:
+            depth = jobs * 2
+
+        ab_name_lst = list(dict.fromkeys(ab_name_lst))
+
+        # members of mostly needed packs come with a single pack download
+        pack_plan = plan_pack_download(
+            self.res_version,
+            [i for i in ab_name_lst if not is_asset_downloaded(self.res_version, i)],
+        )
+
+        ab_name_iter = iter(ab_name_lst)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            future_deque = deque()
+            pack_future_dict = {}
+
+            def submit_next():
+                for ab_name in ab_name_iter:
+                    if is_asset_downloaded(self.res_version, ab_name):
+                        future_deque.append((ab_name, None, False))
+                        continue
+
+                    pack_name = pack_plan.get(ab_name)
+
+                    if pack_name is None:
+                        future = executor.submit(
+                            prefetch_asset, self.res_version, ab_name
+                        )
 
-        raise KeyError(f"{asset_name_prefix} not found")
+                    elif pack_name in pack_future_dict:
+                        future_deque.append(
+                            (ab_name, pack_future_dict[pack_name], False)
+                        )
+                        continue
+
+                    else:
+                        future = executor.submit(
+                            download_pack, self.res_version, pack_name
+                        )
+                        pack_future_dict[pack_name] = future
+
+                    future_deque.append((ab_name, future, True))
+                    return
+
+            for _ in range(depth):
+                submit_next()
+
+            while future_deque:
+                ab_name, future, is_submitter = future_deque.popleft()
+
+                if future is not None:
+                    future.result()
+
+                    if is_submitter:
+                        submit_next()
+
+                # not every pack lists each of its members
+                if not is_asset_downloaded(self.res_version, ab_name):
+                    prefetch_asset(self.res_version, ab_name)
+
+                yield ab_name
+
+    def prefetch(self, ab_name_lst: list[str], jobs: int = 0):
+        for _ in self.iter_prefetch(ab_name_lst, jobs):
+            pass
 
     def load_asset(self, ab_name: str):
         if ab_name in self.asset_dict:
             return self.asset_dict[ab_name]
 
-        asset_filepath = download_asset(self.res_version, ab_name)
+        self.wait_verify_asset()
 
-        asset_env = UnityPy.load(asset_filepath.as_posix())
+        if (
+            get_asset_dat_policy() == AssetDatPolicy.ZIP
+            and not get_asset_filepath(self.res_version, ab_name).is_file()
+        ):
+            # read straight from the zip member, never held whole in memory
+            asset_env = UnityPy.load(open_asset_stream(self.res_version, ab_name))
 
-        self.asset_dict[ab_name] = asset_env
+        else:
+            asset_filepath = download_asset(self.res_version, ab_name)
 
-        return asset_env
+            asset_env = UnityPy.load(asset_filepath.as_posix())
 
-    def register_anon_asset_name(self, ab_name: str, asset_env: UnityPy.Environment):
-        anon_asset_name_set = get_anon_asset_name_set(asset_env)
+        self.asset_dict.put(ab_name, asset_env, get_asset_env_size(asset_env))
 
-        for anon_asset_name in anon_asset_name_set:
+        return asset_env
+
+    def register_anon_asset_name(self, ab_name: str, anon_asset_name_lst: list[str]):
+        for anon_asset_name in anon_asset_name_lst:
             if anon_asset_name not in self.anon_asset_name_dict:
                 self.anon_asset_name_dict[anon_asset_name] = set()
 
@@ -270,16 +751,51 @@ class Resource:
 
         self.anon_ab_name_set = set()
 
-        for ab_info in self.hot_update_list["abInfos"]:
+        anon_ab_info_lst = [
+            ab_info
+            for ab_info in self.hot_update_list["abInfos"]
+            if ab_info["name"].startswith("anon/")
+        ]
+
+        # bundles whose hash is unchanged are not loaded at all
+        anon_index = load_anon_index(self.res_version)
+
+        new_anon_index = {}
+        stale_ab_info_dict = {}
+
+        for ab_info in anon_ab_info_lst:
             ab_name = ab_info["name"]
+            content_key = get_ab_content_key(ab_info)
+
+            index_entry = anon_index.get(ab_name)
 
-            if not ab_name.startswith("anon/"):
-                continue
+            if (
+                content_key
+                and index_entry is not None
+                and index_entry["hash"] == content_key
+            ):
+                new_anon_index[ab_name] = index_entry
+            else:
+                stale_ab_info_dict[ab_name] = ab_info
 
+        # parse each bundle while the following ones are still downloading
+        for ab_name in self.iter_prefetch(list(stale_ab_info_dict)):
             asset_env = self.load_asset(ab_name)
+
+            new_anon_index[ab_name] = {
+                "hash": get_ab_content_key(stale_ab_info_dict[ab_name]),
+                "name_lst": list(get_text_asset_index(asset_env)),
+            }
+
+        for ab_info in anon_ab_info_lst:
+            ab_name = ab_info["name"]
+
             self.anon_ab_name_set.add(ab_name)
 
-            self.register_anon_asset_name(ab_name, asset_env)
+            self.register_anon_asset_name(ab_name, new_anon_index[ab_name]["name_lst"])
+
+        if new_anon_index != anon_index:
+            save_anon_index(self.res_version, new_anon_index)
 
         self.build_level_ab_name_set()
 
@@ -288,34 +804,166 @@ class Resource:
             raise KeyError(f"{ab_name} not loaded")
 
         self.modified_asset_set.add(ab_name)
+        self.uncacheable_asset_set.add(ab_name)
+
+    def add_mod_key(self, ab_name: str, mod_key: list, is_modified: bool):
+        if ab_name not in self.mod_key_dict:
+            self.mod_key_dict[ab_name] = []
+
+        self.mod_key_dict[ab_name].append(mod_key)
+
+        if is_modified:
+            if ab_name not in self.asset_dict:
+                raise KeyError(f"{ab_name} not loaded")
+
+            self.modified_asset_set.add(ab_name)
+
+    def build_mod_asset(self, mod_dirpath: Path, ab_name: str):
+        write_mod(
+            get_mod_filepath(mod_dirpath, ab_name),
+            ab_name,
+            self.asset_dict[ab_name].file.save(),
+        )
+
+    def build_mod_manifest(self, mod_dirpath: Path):
+        write_mod(
+            get_mod_filepath(mod_dirpath, self.manifest_ab_name),
+            self.manifest_ab_name,
+            encode_manifest(self.new_manifest, self.client_version),
+        )
+
+    def build_mod_foreign_asset(self, mod_dirpath: Path, ab_name: str):
+        write_mod_file(
+            get_mod_filepath(mod_dirpath, ab_name),
+            ab_name,
+            self.foreign_asset_dict[ab_name],
+        )
+
+    def get_asset_fingerprint(self, ab_name: str) -> str | None:
+        if ab_name in self.uncacheable_asset_set:
+            return None
+
+        mod_key_lst = self.mod_key_dict.get(ab_name, [])
+
+        # a mod func that could not be fingerprinted
+        if any(mod_key[-1] is None for mod_key in mod_key_lst):
+            return None
+
+        ab_info = get_ab_info_dict(self.res_version).get(ab_name)
+
+        if ab_info is None or not get_ab_content_key(ab_info):
+            return None
+
+        return get_fingerprint(
+            self.client_version,
+            ab_name,
+            get_ab_content_key(ab_info),
+            mod_key_lst,
+        )
 
-    def build_mod(self, mod_name: str):
+    def get_manifest_fingerprint(self) -> str:
+        return get_fingerprint(
+            self.client_version,
+            self.manifest_ab_name,
+            get_manifest_digest(self.new_manifest),
+        )
+
+    def get_foreign_asset_fingerprint(self, ab_name: str) -> str:
+        return get_fingerprint(ab_name, get_file_md5(self.foreign_asset_dict[ab_name]))
+
+    def build_mod(self, mod_name: str, jobs: int = 0) -> BuildReport:
         mod_dirpath = Path(MOD_DIRPATH, mod_name)
 
         mod_dirpath.mkdir(parents=True, exist_ok=True)
 
-        for ab_name in self.modified_asset_set:
-            mod_filepath = get_mod_filepath(mod_dirpath, ab_name)
-            asset_env = self.asset_dict[ab_name]
-            write_mod(mod_filepath, ab_name, asset_env.file.save())
+        is_cache_enabled = is_build_cache_enabled()
 
-        if self.manifest_modified:
-            dump_table(self.new_manifest, f"manifest_{self.res_version}_post.json")
+        build_cache = load_build_cache(mod_name) if is_cache_enabled else {}
+        new_build_cache = {}
 
-            manifest_bytes = get_manifest_bytes(self.new_manifest, self.client_version)
-            write_mod(
-                get_mod_filepath(mod_dirpath, self.manifest_ab_name),
-                self.manifest_ab_name,
-                manifest_bytes,
-            )
+        report = BuildReport()
+
+        task_dict = {}
 
-        for ab_name, ab_path in self.foreign_asset_dict.items():
-            write_mod(
+        def is_hit(ab_name: str, fingerprint: str | None) -> bool:
+            build_cache_entry = build_cache.get(ab_name)
+
+            if not is_cache_enabled or not is_build_cache_hit(
+                build_cache_entry,
+                fingerprint,
                 get_mod_filepath(mod_dirpath, ab_name),
+            ):
+                report.miss_ab_name_lst.append(ab_name)
+                return False
+
+            report.hit_ab_name_lst.append(ab_name)
+            new_build_cache[ab_name] = build_cache_entry
+            return True
+
+        def add_task(ab_name: str, fingerprint: str | None, task):
+            task_dict[ab_name] = partial(
+                run_cached_build_task,
+                task,
                 ab_name,
-                ab_path.read_bytes(),
+                fingerprint if is_cache_enabled else None,
+                get_mod_filepath(mod_dirpath, ab_name),
+                new_build_cache,
             )
 
+        for ab_name in sorted(self.modified_asset_set):
+            fingerprint = self.get_asset_fingerprint(ab_name)
+
+            if not is_hit(ab_name, fingerprint):
+                add_task(
+                    ab_name,
+                    fingerprint,
+                    partial(self.build_mod_asset, mod_dirpath, ab_name),
+                )
+
+        # every mod left these bundles unchanged, drop any stale output
+        for ab_name in sorted(set(self.mod_key_dict) - self.modified_asset_set):
+            get_mod_filepath(mod_dirpath, ab_name).unlink(missing_ok=True)
+
+        if self.manifest_modified:
+            fingerprint = self.get_manifest_fingerprint()
+
+            if not is_hit(self.manifest_ab_name, fingerprint):
+                if is_manifest_dumped():
+                    dump_table(
+                        get_manifest_dict(self.new_manifest),
+                        f"manifest_{self.res_version}_post.json",
+                    )
+
+                add_task(
+                    self.manifest_ab_name,
+                    fingerprint,
+                    partial(self.build_mod_manifest, mod_dirpath),
+                )
+
+        for ab_name in self.foreign_asset_dict:
+            fingerprint = self.get_foreign_asset_fingerprint(ab_name)
+
+            if not is_hit(ab_name, fingerprint):
+                add_task(
+                    ab_name,
+                    fingerprint,
+                    partial(self.build_mod_foreign_asset, mod_dirpath, ab_name),
+                )
+
+        print(
+            f"info: build {mod_name}: {len(report.hit_ab_name_lst)} bundles reused, "
+            f"{len(report.miss_ab_name_lst)} rebuilt"
+        )
+
+        try:
+            run_build_task_dict(task_dict, jobs)
+
+        finally:
+            if is_cache_enabled:
+                save_build_cache(mod_name, new_build_cache)
+
+        return report
+
     def get_table_ab_name(self, table_prefix: str):
         self.load_anon_asset()
 
@@ -344,15 +992,24 @@ class Resource:
 
         table_asset_env = self.load_asset(table_ab_name)
 
-        self.mark_modified_asset(table_ab_name)
-
         data = get_table_data_by_prefix(table_asset_env, table_prefix)
 
         mod_table_func = apply_decorator_lst(mod_table_func, decorator_lst)
 
-        data.m_Script = mod_table_func(data.m_Script)
+        script = mod_table_func(data.m_Script)
+
+        is_modified = script is not UNCHANGED
+
+        if is_modified:
+            data.m_Script = script
 
-        data.save()
+            data.save()
+
+        self.add_mod_key(
+            table_ab_name,
+            ["table", table_prefix, get_func_fingerprint(mod_table_func)],
+            is_modified,
+        )
 
     def get_level_ab_name(self, level_id: str):
         self.load_anon_asset()
@@ -384,15 +1041,24 @@ class Resource:
 
         asset_env = self.load_asset(level_ab_name)
 
-        self.mark_modified_asset(level_ab_name)
-
         level_data = get_level_data_by_level_id(asset_env, level_id)
 
         mod_level_func = apply_decorator_lst(mod_level_func, decorator_lst)
 
-        level_data.m_Script = mod_level_func(level_data.m_Script)
+        script = mod_level_func(level_data.m_Script)
+
+        is_modified = script is not UNCHANGED
 
-        level_data.save()
+        if is_modified:
+            level_data.m_Script = script
+
+            level_data.save()
+
+        self.add_mod_key(
+            level_ab_name,
+            ["level", level_id, get_func_fingerprint(mod_level_func)],
+            is_modified,
+        )
 
     def mark_manifest(self, new_manifest):
         if not self.manifest_loaded:
@@ -0,0 +1,106 @@
+import argparse
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from .helper import (
+    get_ab_info_dict,
+    get_ab_content_key,
+    get_asset_filepath,
+    get_download_connections,
+    prefetch_asset,
+)
+from .asset_store import link_asset
+
+
+@dataclass
+class SyncReport:
+    linked_ab_name_lst: list[str] = field(default_factory=list)
+    changed_ab_name_lst: list[str] = field(default_factory=list)
+    delta_size: int = 0
+
+
+def link_unchanged_asset(old_res_version: str, new_res_version: str, ab_name: str):
+    old_asset_filepath = get_asset_filepath(old_res_version, ab_name)
+    new_asset_filepath = get_asset_filepath(new_res_version, ab_name)
+
+    for old_filepath, new_filepath in (
+        (old_asset_filepath, new_asset_filepath),
+        (
+            old_asset_filepath.with_suffix(".dat"),
+            new_asset_filepath.with_suffix(".dat"),
+        ),
+    ):
+        if old_filepath.is_file() and not new_filepath.is_file():
+            link_asset(old_filepath, new_filepath)
+
+
+def is_asset_local(res_version: str, ab_name: str) -> bool:
+    asset_filepath = get_asset_filepath(res_version, ab_name)
+
+    return asset_filepath.is_file() or asset_filepath.with_suffix(".dat").is_file()
+
+
+def sync(
+    old_res_version: str, new_res_version: str, jobs: int = 0, dry_run=False
+) -> SyncReport:
+    old_ab_info_dict = get_ab_info_dict(old_res_version)
+    new_ab_info_dict = get_ab_info_dict(new_res_version)
+
+    report = SyncReport()
+
+    for ab_name, new_ab_info in new_ab_info_dict.items():
+        old_ab_info = old_ab_info_dict.get(ab_name)
+
+        if old_ab_info is None or not is_asset_local(old_res_version, ab_name):
+            continue
+
+        content_key = get_ab_content_key(new_ab_info)
+
+        if content_key and content_key == get_ab_content_key(old_ab_info):
+            report.linked_ab_name_lst.append(ab_name)
+        else:
+            report.changed_ab_name_lst.append(ab_name)
+            report.delta_size += new_ab_info.get("totalSize", 0)
+
+    print(
+        f"info: {old_res_version} -> {new_res_version}: "
+        f"{len(report.linked_ab_name_lst)} unchanged, "
+        f"{len(report.changed_ab_name_lst)} changed, "
+        f"{report.delta_size} bytes to download"
+    )
+
+    if dry_run:
+        return report
+
+    for ab_name in report.linked_ab_name_lst:
+        link_unchanged_asset(old_res_version, new_res_version, ab_name)
+
+    if jobs <= 0:
+        jobs = get_download_connections()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for _ in executor.map(
+            lambda ab_name: prefetch_asset(new_res_version, ab_name),
+            report.changed_ab_name_lst,
+        ):
+            pass
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="download only the bundles changed between two res_versions"
+    )
+    parser.add_argument("old_res_version")
+    parser.add_argument("new_res_version")
+    parser.add_argument("-j", "--jobs", type=int, default=0)
+    parser.add_argument("-n", "--dry-run", action="store_true")
+
+    args = parser.parse_args()
+
+    sync(args.old_res_version, args.new_res_version, args.jobs, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
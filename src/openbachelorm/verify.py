@@ -0,0 +1,121 @@
+import json
+import hashlib
+from pathlib import Path
+
+from .const import ASSET_DIRPATH
+from .downloader import get_part_filepath
+from .asset_store import remove_asset_blob, get_asset_store_filepath
+
+
+VERIFY_RECORD_JSON = "verify_record.json"
+
+
+def get_verify_record_filepath(res_version: str) -> Path:
+    return Path(ASSET_DIRPATH, res_version, VERIFY_RECORD_JSON)
+
+
+def load_verify_record(res_version: str) -> dict[str, list[int]]:
+    try:
+        with open(get_verify_record_filepath(res_version), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_verify_record(res_version: str, verify_record: dict[str, list[int]]):
+    verify_record_filepath = get_verify_record_filepath(res_version)
+
+    verify_record_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    part_filepath = get_part_filepath(verify_record_filepath)
+
+    try:
+        with open(part_filepath, "w", encoding="utf-8") as f:
+            json.dump(verify_record, f)
+
+        part_filepath.replace(verify_record_filepath)
+
+    finally:
+        part_filepath.unlink(missing_ok=True)
+
+
+def get_file_stamp(filepath: Path) -> list[int] | None:
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def get_file_md5(filepath: Path) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, "md5").hexdigest()
+
+
+def verify_file(
+    filepath: Path, size: int | None, md5: str | None, stamp_record: list[int] | None
+) -> list[int] | None:
+    stamp = get_file_stamp(filepath)
+
+    if stamp is None or stamp == stamp_record:
+        return stamp
+
+    if size is not None and stamp[0] != size:
+        raise ValueError(f"{filepath} size mismatch")
+
+    if md5 and get_file_md5(filepath) != md5.lower():
+        raise ValueError(f"{filepath} md5 mismatch")
+
+    return stamp
+
+
+def verify_asset(
+    res_version: str, ab_info: dict, verify_record: dict[str, list[int]]
+) -> tuple[bool, dict[str, list[int] | None]]:
+    ab_rel_filepath = Path(ab_info["name"])
+    dat_rel_filepath = ab_rel_filepath.with_suffix(".dat")
+
+    ab_filepath = Path(ASSET_DIRPATH, res_version, ab_rel_filepath)
+    dat_filepath = Path(ASSET_DIRPATH, res_version, dat_rel_filepath)
+
+    ab_key = ab_rel_filepath.as_posix()
+    dat_key = dat_rel_filepath.as_posix()
+
+    try:
+        dat_stamp = verify_file(
+            dat_filepath,
+            ab_info.get("totalSize"),
+            ab_info.get("md5"),
+            verify_record.get(dat_key),
+        )
+    except ValueError as e:
+        print(f"info: {e}")
+
+        dat_filepath.unlink(missing_ok=True)
+        ab_filepath.unlink(missing_ok=True)
+
+        # the blobs are shared with the links just removed
+        if ab_info.get("md5"):
+            remove_asset_blob(ab_info["md5"])
+
+        return False, {dat_key: None, ab_key: None}
+
+    try:
+        ab_stamp = verify_file(
+            ab_filepath,
+            ab_info.get("abSize"),
+            None,
+            verify_record.get(ab_key),
+        )
+    except ValueError as e:
+        print(f"info: {e}")
+
+        ab_filepath.unlink(missing_ok=True)
+
+        if ab_info.get("md5"):
+            get_asset_store_filepath(ab_info["md5"], ".ab").unlink(missing_ok=True)
+
+        return False, {dat_key: dat_stamp, ab_key: None}
+
+    return True, {dat_key: dat_stamp, ab_key: ab_stamp}
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from openbachelorm import resource
+from openbachelorm.config import config
+from openbachelorm.const import AssetDatPolicy
+from openbachelorm.resource import AssetEnvDict, Resource
+
+
+class FakeData:
+    def __init__(self):
+        self.m_Script = "x"
+
+    def save(self):
+        pass
+
+
+class FakeEnv:
+    def __init__(self, ab_name: str):
+        self.ab_name = ab_name
+        self.data = FakeData()
+
+
+def new_resource() -> Resource:
+    res = Resource.__new__(Resource)
+
+    res.client_version = "2.6.41"
+    res.res_version = "rv"
+    res.modified_asset_set = set()
+    res.mod_key_dict = {}
+    res.uncacheable_asset_set = set()
+    res.asset_dict = AssetEnvDict(res.modified_asset_set)
+    res.verify_future = None
+
+    return res
+
+
+def test_asset_env_lru_pinned_over_budget(monkeypatch):
+    size_dict = {"a": 80, "b": 50, "c": 30}
+
+    monkeypatch.setitem(config, "asset_env_budget", 100)
+    monkeypatch.setattr(resource, "asset_env_lru", resource.AssetEnvLru())
+    monkeypatch.setattr(resource, "get_asset_dat_policy", lambda: AssetDatPolicy.KEEP)
+    monkeypatch.setattr(
+        resource, "download_asset", lambda res_version, ab_name: Path(ab_name)
+    )
+    monkeypatch.setattr(
+        resource.UnityPy, "load", lambda filepath_str: FakeEnv(filepath_str)
+    )
+    monkeypatch.setattr(
+        resource, "get_asset_env_size", lambda asset_env: size_dict[asset_env.ab_name]
+    )
+    monkeypatch.setattr(
+        resource, "get_table_data_by_prefix", lambda asset_env, prefix: asset_env.data
+    )
+
+    res = new_resource()
+    res.get_table_ab_name = lambda table_prefix: table_prefix
+
+    res.mod_table("a", lambda script: script + "y", [], no_manifest=True)
+
+    assert res.modified_asset_set == {"a"}
+
+    # the pinned bundle alone is over budget, the new one must stay loaded
+    res.mod_table("b", lambda script: script + "y", [], no_manifest=True)
+
+    assert "a" in res.asset_dict
+    assert "b" in res.asset_dict
+    assert res.modified_asset_set == {"a", "b"}
+
+    # unpinned bundles are still evicted once something newer is loaded
+    res.modified_asset_set.discard("b")
+    res.load_asset("c")
+
+    assert "b" not in res.asset_dict
+    assert "c" in res.asset_dict
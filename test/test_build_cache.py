@@ -0,0 +1,89 @@
+from functools import partial
+
+from openbachelorm.build_cache import get_func_fingerprint
+from openbachelorm.helper import apply_decorator_lst, get_mod_level_decorator_lst
+
+
+SCALE = 100
+
+
+def mod_a(table):
+    table["atk"] *= SCALE
+    return table
+
+
+def mod_b(table):
+    table["atk"] *= SCALE + 1
+    return table
+
+
+def test_func_fingerprint():
+    assert get_func_fingerprint(mod_a) == get_func_fingerprint(mod_a)
+    assert get_func_fingerprint(mod_a) != get_func_fingerprint(mod_b)
+
+    fingerprint = get_func_fingerprint(mod_a)
+
+    global SCALE
+    SCALE = 200
+
+    try:
+        assert get_func_fingerprint(mod_a) != fingerprint
+    finally:
+        SCALE = 100
+
+    assert get_func_fingerprint(
+        apply_decorator_lst(mod_a, get_mod_level_decorator_lst("l", "2.6.41", "rv"))
+    ) != get_func_fingerprint(
+        apply_decorator_lst(mod_a, get_mod_level_decorator_lst("l", "2.6.21", "rv"))
+    )
+
+
+SCALE_DICT = {"atk": 100, "def": 10}
+
+
+def mod_c(table):
+    table["atk"] *= SCALE_DICT["atk"]
+    return table
+
+
+def mod_c_with_set(table, char_id_set):
+    for char_id in char_id_set:
+        table[char_id]["atk"] *= 2
+    return table
+
+
+def test_func_fingerprint_dict():
+    fingerprint = get_func_fingerprint(mod_c)
+
+    SCALE_DICT["atk"] = 200
+
+    try:
+        assert get_func_fingerprint(mod_c) != fingerprint
+    finally:
+        SCALE_DICT["atk"] = 100
+
+    assert get_func_fingerprint(mod_c) == fingerprint
+
+    mod_d = partial(mod_c_with_set, char_id_set={"char_002", "char_001"})
+
+    assert get_func_fingerprint(mod_d) == get_func_fingerprint(
+        partial(mod_c_with_set, char_id_set={"char_001", "char_002"})
+    )
+    assert get_func_fingerprint(mod_d) != get_func_fingerprint(
+        partial(mod_c_with_set, char_id_set={"char_001"})
+    )
+
+
+class Scaler:
+    def __init__(self, scale):
+        self.scale = scale
+
+
+def test_func_fingerprint_uncacheable():
+    scaler = Scaler(100)
+
+    def mod_e(table):
+        table["atk"] *= scaler.scale
+        return table
+
+    assert get_func_fingerprint(mod_e) is None
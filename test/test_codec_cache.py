@@ -0,0 +1,83 @@
+import os
+import pickle
+
+from openbachelorm import codec_cache
+from openbachelorm.codec_cache import (
+    cached_codec,
+    get_codec_cache_key,
+    get_codec_cache_filepath,
+)
+from openbachelorm.config import config
+
+
+def test_cached_codec(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(codec_cache, "codec_cache_size", None)
+
+    call_lst = []
+
+    def decode(data):
+        call_lst.append(data)
+        return data.upper()
+
+    tag = ("decode_flatc", "flatc", "2.6.41", "character_table")
+
+    assert cached_codec(tag, b"abc", decode) == b"ABC"
+    assert cached_codec(tag, b"abc", decode) == b"ABC"
+    assert len(call_lst) == 1
+
+    # another client_version or fbs_name is another entry
+    assert (
+        cached_codec(
+            ("decode_flatc", "flatc", "2.6.21", "character_table"), b"abc", decode
+        )
+        == b"ABC"
+    )
+    assert len(call_lst) == 2
+
+    assert cached_codec(tag, b"abd", decode) == b"ABD"
+    assert len(call_lst) == 3
+
+    # so is a bumped cache version
+    monkeypatch.setattr(
+        codec_cache, "CODEC_CACHE_VERSION", codec_cache.CODEC_CACHE_VERSION + 1
+    )
+
+    assert cached_codec(tag, b"abc", decode) == b"ABC"
+    assert len(call_lst) == 4
+
+    # a corrupt entry is a miss
+    get_codec_cache_filepath(get_codec_cache_key(tag, b"abc")).write_bytes(b"x")
+
+    assert cached_codec(tag, b"abc", decode) == b"ABC"
+    assert len(call_lst) == 5
+
+
+def test_evict_codec_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(codec_cache, "codec_cache_size", None)
+
+    entry_size = len(pickle.dumps(b"a" * 1000, pickle.HIGHEST_PROTOCOL))
+
+    monkeypatch.setitem(config, "codec_cache_budget", int(entry_size * 3.5))
+
+    def get_cache_filepath(data: bytes):
+        return get_codec_cache_filepath(get_codec_cache_key(("tag",), data))
+
+    for i, data in enumerate((b"a", b"b", b"c")):
+        cached_codec(("tag",), data, lambda data: data * 1000)
+
+        # oldest first
+        os.utime(get_cache_filepath(data), (1000 + i, 1000 + i))
+
+    # a hit makes the entry the most recently used
+    cached_codec(("tag",), b"a", lambda data: data * 1000)
+
+    cached_codec(("tag",), b"d", lambda data: data * 1000)
+
+    assert get_cache_filepath(b"a").is_file()
+    assert not get_cache_filepath(b"b").is_file()
+    assert get_cache_filepath(b"c").is_file()
+    assert get_cache_filepath(b"d").is_file()
+
+    assert codec_cache.codec_cache_size == entry_size * 3
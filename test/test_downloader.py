@@ -0,0 +1,351 @@
+import hashlib
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from openbachelorm import cache_gc, helper
+from openbachelorm.config import config
+from openbachelorm.downloader import HttpConnectionPool, http_download_file
+
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.request_lst.append((self.path, id(self.connection)))
+
+        if self.path in self.server.fail_dict and self.server.fail_dict[self.path]:
+            self.server.fail_dict[self.path] -= 1
+            self.send_error(503)
+            return
+
+        super().do_GET()
+
+
+@pytest.fixture
+def fixture_server(tmp_path):
+    fixture_dirpath = tmp_path / "fixture"
+    fixture_dirpath.mkdir()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        partial(FixtureRequestHandler, directory=fixture_dirpath.as_posix()),
+    )
+    server.request_lst = []
+    server.fail_dict = {}
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server, fixture_dirpath, f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_download_file(fixture_server, tmp_path, monkeypatch):
+    server, fixture_dirpath, url_prefix = fixture_server
+
+    monkeypatch.setitem(config, "download_backoff", 0)
+
+    (fixture_dirpath / "a.dat").write_bytes(b"a" * 100000)
+    (fixture_dirpath / "b.dat").write_bytes(b"b")
+
+    pool = HttpConnectionPool()
+
+    http_download_file(f"{url_prefix}/a.dat", tmp_path / "a.dat", pool)
+    http_download_file(f"{url_prefix}/b.dat", tmp_path / "b.dat", pool)
+
+    assert (tmp_path / "a.dat").read_bytes() == b"a" * 100000
+    assert (tmp_path / "b.dat").read_bytes() == b"b"
+
+    # keep-alive
+    assert len({i[1] for i in server.request_lst}) == 1
+
+    server.fail_dict["/b.dat"] = 2
+
+    (tmp_path / "b.dat").unlink()
+    http_download_file(f"{url_prefix}/b.dat", tmp_path / "b.dat", pool)
+
+    assert (tmp_path / "b.dat").read_bytes() == b"b"
+
+    with pytest.raises(ConnectionError):
+        http_download_file(f"{url_prefix}/c.dat", tmp_path / "c.dat", pool)
+
+    assert not (tmp_path / "c.dat").exists()
+    assert not list(tmp_path.glob("*.part"))
+
+    pool.close()
+
+
+def test_download_file_http_backend(fixture_server, tmp_path, monkeypatch):
+    _, fixture_dirpath, url_prefix = fixture_server
+
+    monkeypatch.setitem(config, "downloader", "http")
+
+    (fixture_dirpath / "a.dat").write_bytes(b"a")
+
+    helper.download_file(f"{url_prefix}/a.dat", tmp_path / "x" / "a.dat")
+
+    assert (tmp_path / "x" / "a.dat").read_bytes() == b"a"
+
+
+class TruncatedRequestHandler(FixtureRequestHandler):
+    def do_GET(self):
+        self.server.request_lst.append((self.path, id(self.connection)))
+
+        body = b"a" * 1000
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if len(self.server.request_lst) == 1:
+            self.wfile.write(body[:100])
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+def test_http_download_file_truncated(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TruncatedRequestHandler)
+    server.request_lst = []
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        monkeypatch.setitem(config, "download_backoff", 0)
+
+        pool = HttpConnectionPool()
+
+        http_download_file(
+            f"http://127.0.0.1:{server.server_address[1]}/a.dat",
+            tmp_path / "a.dat",
+            pool,
+        )
+
+        assert len(server.request_lst) == 2
+        assert (tmp_path / "a.dat").read_bytes() == b"a" * 1000
+        assert not list(tmp_path.glob("*.part"))
+
+        pool.close()
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class ValidatorRequestHandler(FixtureRequestHandler):
+    def do_GET(self):
+        self.server.request_lst.append((self.path, id(self.connection)))
+
+        body = self.server.body_dict[self.path]
+        etag = f'"{hash(body)}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_refresh_hot_update_list(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ValidatorRequestHandler)
+    server.request_lst = []
+    server.body_dict = {"/rv/hot_update_list.json": b'{"abInfos": []}'}
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            helper,
+            "ORIG_ASSET_URL_PREFIX",
+            f"http://127.0.0.1:{server.server_address[1]}",
+        )
+        monkeypatch.setitem(config, "revalidate_hot_update_list", True)
+        monkeypatch.setattr(helper, "revalidated_res_version_set", set())
+
+        hot_update_list_filepath = helper.download_hot_update_list("rv")
+
+        assert hot_update_list_filepath.read_bytes() == b'{"abInfos": []}'
+
+        # revalidated once per process
+        helper.download_hot_update_list("rv")
+        assert len(server.request_lst) == 1
+
+        assert not helper.refresh_hot_update_list("rv")
+        assert hot_update_list_filepath.read_bytes() == b'{"abInfos": []}'
+
+        server.body_dict["/rv/hot_update_list.json"] = b'{"abInfos": [{}]}'
+
+        assert helper.refresh_hot_update_list("rv")
+        assert hot_update_list_filepath.read_bytes() == b'{"abInfos": [{}]}'
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    monkeypatch.setitem(config, "download_retries", 0)
+
+    # the server is gone, the cached copy is kept
+    assert not helper.refresh_hot_update_list("rv")
+    assert hot_update_list_filepath.read_bytes() == b'{"abInfos": [{}]}'
+
+    with pytest.raises(ConnectionError):
+        helper.refresh_hot_update_list("rv2")
+
+
+def test_download_asset_corrupt_dat(fixture_server, tmp_path, monkeypatch):
+    _, fixture_dirpath, url_prefix = fixture_server
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(helper, "ORIG_ASSET_URL_PREFIX", url_prefix)
+    # the access index is flushed at exit, relative to the cwd of that time
+    monkeypatch.setattr(cache_gc, "access_dict", {})
+    monkeypatch.setitem(config, "downloader", "http")
+    monkeypatch.setitem(config, "download_backoff", 0)
+
+    content = b"bundle" * 1000
+
+    (fixture_dirpath / "rv").mkdir()
+
+    with ZipFile(fixture_dirpath / "rv" / "a.dat", "w", ZIP_DEFLATED) as zf:
+        zf.writestr("a.ab", content)
+
+    dat_bytes = (fixture_dirpath / "rv" / "a.dat").read_bytes()
+
+    (fixture_dirpath / "rv" / "hot_update_list.json").write_text(
+        json.dumps(
+            {
+                "abInfos": [
+                    {
+                        "name": "a.ab",
+                        "md5": hashlib.md5(dat_bytes).hexdigest(),
+                        "totalSize": len(dat_bytes),
+                    }
+                ]
+            }
+        )
+    )
+
+    helper.get_ab_info_dict.cache_clear()
+
+    try:
+        asset_dat_filepath = helper.get_asset_dat_filepath("rv", "a.ab")
+        asset_dat_filepath.parent.mkdir(parents=True)
+
+        # same size, so only the zip itself tells it apart
+        asset_dat_filepath.write_bytes(b"\0" * len(dat_bytes))
+
+        assert helper.download_asset("rv", "a.ab").read_bytes() == content
+        assert asset_dat_filepath.read_bytes() == dat_bytes
+
+        # truncated by an interrupted run
+        helper.remove_asset_dat("rv", "a.ab")
+        asset_dat_filepath.write_bytes(dat_bytes[:100])
+
+        with helper.open_asset_stream("rv", "a.ab") as f:
+            assert f.read() == content
+
+        assert asset_dat_filepath.read_bytes() == dat_bytes
+
+    finally:
+        helper.get_ab_info_dict.cache_clear()
+
+
+def test_download_pack(fixture_server, tmp_path, monkeypatch):
+    _, fixture_dirpath, url_prefix = fixture_server
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(helper, "ORIG_ASSET_URL_PREFIX", url_prefix)
+    monkeypatch.setattr(cache_gc, "access_dict", {})
+    monkeypatch.setitem(config, "downloader", "http")
+
+    content_dict = {"a.ab": b"a" * 1000, "b.ab": b"b" * 2000, "c.ab": b"c" * 3000}
+
+    for res_version in ("rv", "rv2"):
+        (fixture_dirpath / res_version).mkdir()
+
+        with ZipFile(
+            fixture_dirpath / res_version / "pack_1.dat", "w", ZIP_DEFLATED
+        ) as zf:
+            for ab_name, content in content_dict.items():
+                zf.writestr(ab_name, content)
+
+        pack_bytes = (fixture_dirpath / res_version / "pack_1.dat").read_bytes()
+
+        (fixture_dirpath / res_version / "hot_update_list.json").write_text(
+            json.dumps(
+                {
+                    "abInfos": [
+                        {"name": "a.ab", "pid": "pack_1", "abSize": 1000},
+                        {"name": "b.ab", "pid": "pack_1", "abSize": 2000},
+                        # does not match the pack member
+                        {"name": "c.ab", "pid": "pack_1", "abSize": 1},
+                        # pack_2 is not in packInfos
+                        {"name": "d.ab", "pid": "pack_2", "abSize": 1},
+                        {"name": "e.ab", "pid": "pack_2", "abSize": 1},
+                    ],
+                    "packInfos": [
+                        {
+                            "name": "pack_1",
+                            "md5": hashlib.md5(pack_bytes).hexdigest()
+                            if res_version == "rv"
+                            else "0" * 32,
+                            "totalSize": len(pack_bytes),
+                        }
+                    ],
+                }
+            )
+        )
+
+    def cache_clear():
+        helper.get_ab_info_dict.cache_clear()
+        helper.get_pack_info_dict.cache_clear()
+        helper.get_pack_member_dict.cache_clear()
+
+    cache_clear()
+
+    try:
+        assert helper.plan_pack_download(
+            "rv", ["a.ab", "b.ab", "c.ab", "d.ab", "e.ab"]
+        ) == {"a.ab": "pack_1", "b.ab": "pack_1", "c.ab": "pack_1"}
+
+        helper.download_pack("rv", "pack_1")
+
+        for ab_name in ("a.ab", "b.ab"):
+            assert (
+                helper.get_asset_filepath("rv", ab_name).read_bytes()
+                == content_dict[ab_name]
+            )
+
+        # left to the per-bundle download
+        assert not helper.is_asset_downloaded("rv", "c.ab")
+
+        # a pack failing its md5 extracts nothing
+        helper.download_pack("rv2", "pack_1")
+
+        for ab_name in content_dict:
+            assert not helper.is_asset_downloaded("rv2", ab_name)
+
+        assert not list(tmp_path.glob("tmp/**/*.dat"))
+
+    finally:
+        cache_clear()
@@ -0,0 +1,292 @@
+import json
+import shutil
+from copy import deepcopy
+
+import flatbuffers
+import pytest
+
+from openbachelorm.fbs_codec import parse_fbs_schema
+from openbachelorm.fbs_codegen.v2_6_41 import (
+    prts___levels_generated as prts___levels_v2_6_41,
+)
+from openbachelorm.helper import (
+    get_fbs_schema,
+    run_flatc_decode,
+    run_flatc_decode_many,
+    run_flatc_encode,
+    run_flatc_encode_many,
+    RESOURCE_MANIFEST,
+)
+from openbachelorm.manifest_view import (
+    ManifestView,
+    ManifestAppendView,
+    get_manifest_bundle_name_lst,
+    get_manifest_asset_name_lst,
+    get_manifest_field_lst,
+    get_manifest_column_lst,
+)
+
+
+SAMPLE_FBS = """
+// comment
+enum enum__Sample_Direction : int {
+    UP = 0,
+    RIGHT = 1,
+    E_NUM = 2,
+    INVALID = 2,
+}
+
+table dict__string__float {
+    key: string(key);
+    value: float;
+}
+
+table dict__int__string {
+    key: int(key);
+    value: string;
+}
+
+table clz_Sample {
+    direction: enum__Sample_Direction;
+    ratio: float;
+    scale: double;
+    flags: [bool];
+    floatDict: [dict__string__float];
+    intDict: [dict__int__string];
+}
+
+root_type clz_Sample;
+"""
+
+
+def test_sample_schema():
+    schema = parse_fbs_schema(SAMPLE_FBS)
+
+    table = schema.decode(
+        schema.encode(
+            {
+                "direction": 2,
+                "ratio": 0.1,
+                "scale": 0.1,
+                "flags": [True, False],
+                "floatDict": [
+                    {"key": "b", "value": 1e-7},
+                    {"key": "a", "value": 2.5},
+                ],
+                "intDict": [
+                    {"key": 3, "value": "c"},
+                    {"value": "zero"},
+                ],
+            }
+        )
+    )
+
+    assert table == {
+        "direction": "E_NUM",
+        "ratio": 0.1,
+        "scale": 0.1,
+        "flags": [True, False],
+        "floatDict": [
+            {"key": "a", "value": 2.5},
+            {"key": "b", "value": 0.0},
+        ],
+        "intDict": [
+            {"key": 0, "value": "zero"},
+            {"key": 3, "value": "c"},
+        ],
+    }
+
+
+def test_sample_schema_error():
+    schema = parse_fbs_schema(SAMPLE_FBS)
+
+    with pytest.raises(ValueError):
+        schema.encode({"unknown": 1})
+
+    with pytest.raises(ValueError):
+        schema.encode({"direction": 1.5})
+
+    with pytest.raises(ValueError):
+        schema.encode({"floatDict": [{"value": 1.0}]})
+
+    with pytest.raises(ValueError):
+        schema.decode(b"\xff\xff")
+
+
+LEVEL = {
+    "options": {
+        "characterLimit": 8,
+        "maxLifePoint": 3,
+        "initialCost": 10,
+        "maxCost": 99,
+        "costIncreaseTime": 1.0,
+    },
+    "mapData": {
+        "map": {"row_size": 1, "column_size": 2, "matrix_data": [0, 1]},
+        "tiles": [
+            {"tileKey": "tile_start", "heightType": "LOWLAND", "passableMask": "ALL"},
+            {"tileKey": "tile_end", "heightType": "HIGHLAND", "passableMask": "ALL"},
+        ],
+    },
+    "enemyDbRefs": [
+        {"useDb": True, "id": "enemy_1007_slime"},
+    ],
+}
+
+
+def test_prts___levels_codegen():
+    schema = get_fbs_schema("2.6.41", "prts___levels")
+
+    level_bytes = schema.encode(LEVEL)
+
+    level_obj = prts___levels_v2_6_41.clz_Torappu_LevelDataT.InitFromPackedBuf(
+        level_bytes
+    )
+
+    assert level_obj.options.maxLifePoint == 3
+    assert level_obj.enemyDbRefs[0].id == b"enemy_1007_slime"
+
+    builder = flatbuffers.Builder()
+    builder.Finish(level_obj.Pack(builder))
+
+    assert schema.decode(bytes(builder.Output())) == schema.decode(level_bytes)
+
+
+MANIFEST = {
+    "rawCount": 2,
+    "bundles": [
+        {"name": "a.ab", "props": 1, "sccIndex": 0, "allDependencies": [1]},
+        {"name": "b.ab", "sccIndex": 1},
+    ],
+    "assetToBundleList": [
+        {"assetName": "gamedata/excel/a", "bundleIndex": 0, "name": "a", "path": ""},
+        {"assetName": "gamedata/excel/b", "bundleIndex": 1},
+    ],
+}
+
+
+@pytest.mark.skipif(shutil.which("flatc") is None, reason="flatc not found")
+def test_resource_manifest_flatc():
+    schema = get_fbs_schema("2.6.41", RESOURCE_MANIFEST)
+
+    manifest_bytes = schema.encode(MANIFEST)
+
+    assert manifest_bytes == run_flatc_encode(
+        json.dumps(MANIFEST), "2.6.41", RESOURCE_MANIFEST
+    )
+
+    assert schema.decode(manifest_bytes) == json.loads(
+        run_flatc_decode(manifest_bytes, "2.6.41", RESOURCE_MANIFEST)
+    )
+
+
+@pytest.mark.skipif(shutil.which("flatc") is None, reason="flatc not found")
+def test_resource_manifest_flatc_many():
+    schema = get_fbs_schema("2.6.41", RESOURCE_MANIFEST)
+
+    manifest_lst = [MANIFEST, {"rawCount": 0}, {**MANIFEST, "rawCount": 3}]
+
+    manifest_bytes_lst = run_flatc_encode_many(
+        [json.dumps(i) for i in manifest_lst], "2.6.41", RESOURCE_MANIFEST
+    )
+
+    assert manifest_bytes_lst == [schema.encode(i) for i in manifest_lst]
+
+    assert [
+        json.loads(i)
+        for i in run_flatc_decode_many(manifest_bytes_lst, "2.6.41", RESOURCE_MANIFEST)
+    ] == [schema.decode(i) for i in manifest_bytes_lst]
+
+
+LEGACY_MANIFEST = {
+    "rawCount": 2,
+    "bundles": [
+        {
+            "name": "a.ab",
+            "isCacheable": True,
+            "sccIndex": 0,
+            "directDependencies": [1],
+            "allDependencies": [1],
+        },
+        {"name": "b.ab", "sccIndex": 1, "allDependencies": []},
+    ],
+    "assetToBundleList": MANIFEST["assetToBundleList"],
+}
+
+
+@pytest.mark.parametrize(
+    "client_version, manifest",
+    [("2.6.41", MANIFEST), ("2.4.61", LEGACY_MANIFEST)],
+)
+def test_manifest_view(client_version, manifest):
+    schema = get_fbs_schema(client_version, RESOURCE_MANIFEST)
+
+    manifest_bytes = schema.encode(manifest)
+
+    manifest_view = ManifestView(manifest_bytes, client_version)
+
+    assert manifest_view.to_dict() == schema.decode(manifest_bytes)
+    assert deepcopy(manifest_view) == schema.decode(manifest_bytes)
+
+    assert manifest_view["bundles"][-1]["name"] == "b.ab"
+    assert get_manifest_asset_name_lst(manifest_view) == [
+        "gamedata/excel/a",
+        "gamedata/excel/b",
+    ]
+
+    # columns read straight from the buffer match the decoded entries
+    for vector_name, field_name, default in (
+        ("bundles", "sccIndex", 0),
+        ("bundles", "allDependencies", None),
+        ("bundles", "props", 0),
+        ("bundles", "isCacheable", False),
+        ("assetToBundleList", "bundleIndex", 0),
+        ("assetToBundleList", "path", None),
+    ):
+        assert get_manifest_field_lst(
+            manifest_view, vector_name, field_name, default
+        ) == get_manifest_field_lst(
+            schema.decode(manifest_bytes), vector_name, field_name, default
+        )
+
+    bundle_field_default_lst = [
+        ("name", None),
+        ("props", 0),
+        ("isCacheable", False),
+        ("directDependencies", None),
+    ]
+    assert get_manifest_column_lst(
+        manifest_view, "bundles", bundle_field_default_lst
+    ) == get_manifest_column_lst(
+        schema.decode(manifest_bytes), "bundles", bundle_field_default_lst
+    )
+
+
+@pytest.mark.parametrize(
+    "client_version, manifest",
+    [("2.6.41", MANIFEST), ("2.4.61", LEGACY_MANIFEST)],
+)
+def test_manifest_append_view(client_version, manifest):
+    schema = get_fbs_schema(client_version, RESOURCE_MANIFEST)
+
+    manifest_bytes = schema.encode(manifest)
+
+    new_manifest = ManifestAppendView(ManifestView(manifest_bytes, client_version))
+
+    bundle = {"name": "c.ab", "sccIndex": 2}
+    new_manifest["bundles"].append(bundle)
+    new_manifest["bundles"][2]["allDependencies"] = [0, 1]
+
+    new_manifest["assetToBundleList"].append(
+        {"assetName": "gamedata/excel/c", "bundleIndex": 2, "name": "c"}
+    )
+
+    expected_manifest = schema.decode(manifest_bytes)
+    expected_manifest["bundles"].append(bundle)
+    expected_manifest["assetToBundleList"].append(
+        {"assetName": "gamedata/excel/c", "bundleIndex": 2, "name": "c"}
+    )
+
+    assert new_manifest.to_dict() == expected_manifest
+    assert schema.decode(new_manifest.build()) == expected_manifest
+    assert get_manifest_bundle_name_lst(new_manifest) == ["a.ab", "b.ab", "c.ab"]